@@ -9,19 +9,27 @@ Date: August 14, 2025
 
 import sys
 import os
+import asyncio
 from pathlib import Path
 
 # Add parent directory for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
-
-from emf_chaos_window import EMFChaosMainWindow
-
 def main():
     """Main application entry point"""
+    # PyQt6 and the window module are imported here rather than at module
+    # top so importing this entry point stays cheap until the GUI is needed
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import Qt
+    from qasync import QEventLoop
+    
+    from emf_chaos_window import EMFChaosMainWindow
+    
+    # High DPI scaling is always on in PyQt6; keep Retina's fractional
+    # scale factors instead of rounding them (must be set before QApplication)
+    QApplication.setHighDpiScaleFactorRoundingPolicy(
+        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+    
     # Create QApplication
     app = QApplication(sys.argv)
     
@@ -31,20 +39,16 @@ def main():
     app.setOrganizationName("AIMF LLC")
     app.setApplicationDisplayName("🚨📱 EMF Chaos Engine - Viral $10-20M Warfare Suite")
     
-    # Enable high DPI scaling for Mac (PyQt6 compatible)
-    try:
-        app.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling)
-        app.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps)
-    except AttributeError:
-        # PyQt6 newer versions handle this automatically
-        pass
-    
     # Create and show main window
     window = EMFChaosMainWindow()
     window.show()
     
-    # Start event loop
-    sys.exit(app.exec())
+    # Run Qt on an asyncio-compatible loop so async slots (log export)
+    # can await worker threads without blocking the UI
+    loop = QEventLoop(app)
+    asyncio.set_event_loop(loop)
+    with loop:
+        loop.run_forever()
 
 if __name__ == "__main__":
     main()
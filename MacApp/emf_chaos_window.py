@@ -9,21 +9,139 @@ Date: August 14, 2025
 
 import sys
 import os
+import asyncio
 import json
+import re
+import time
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QLabel, QTextEdit, QPushButton, 
+    QTabWidget, QLabel, QPlainTextEdit, QPushButton, 
     QGroupBox, QStatusBar, QFrame, QMessageBox
 )
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont, QAction, QPixmap
+from qasync import asyncSlot
+
+# Pre-scaled header logo lives here between launches
+LOGO_CACHE_DIR = Path.home() / "Library" / "Caches" / "emf_chaos"
 
 class EMFChaosMainWindow(QMainWindow):
     """Main EMF Chaos Engine Application Window"""
     
+    # Lines kept by the scrolling text displays before the oldest are dropped
+    _MAX_DISPLAY_LINES = 2000
+    
+    # Stats/status refresh cadence - fast while detecting, slow when idle
+    _UPDATE_INTERVAL_ACTIVE_MS = 500
+    _UPDATE_INTERVAL_IDLE_MS = 10000
+    
+    # Log lines matching this also go to the live detection display
+    _DETECTION_RE = re.compile(r'detection|scan|hackrf|gsm', re.IGNORECASE)
+    
+    # Shared stylesheets - defined once so identical widgets reuse the same
+    # string instead of each carrying its own inline copy
+    _QSS_START_BUTTON = """
+        QPushButton {
+            background: #00ff41;
+            color: #000;
+            font-weight: bold;
+            font-size: 14px;
+            border-radius: 10px;
+            padding: 10px;
+        }
+        QPushButton:hover {
+            background: #4ecdc4;
+        }
+        QPushButton:pressed {
+            background: #00cc33;
+        }
+    """
+    
+    _QSS_STOP_BUTTON = """
+        QPushButton {
+            background: #ff6b6b;
+            color: #fff;
+            font-weight: bold;
+            font-size: 14px;
+            border-radius: 10px;
+            padding: 10px;
+        }
+        QPushButton:hover {
+            background: #ff5252;
+        }
+        QPushButton:disabled {
+            background: #666;
+            color: #999;
+        }
+    """
+    
+    _QSS_TEAL_BUTTON = """
+        QPushButton {
+            background: #4ecdc4;
+            color: #000;
+            font-weight: bold;
+            padding: 10px 20px;
+            border-radius: 8px;
+        }
+        QPushButton:hover {
+            background: #45b7d1;
+        }
+    """
+    
+    _QSS_RED_BUTTON = """
+        QPushButton {
+            background: #ff6b6b;
+            color: #fff;
+            font-weight: bold;
+            padding: 10px 20px;
+            border-radius: 8px;
+        }
+        QPushButton:hover {
+            background: #ff5252;
+        }
+    """
+    
+    _QSS_TERMINAL_TEXTEDIT = """
+        QPlainTextEdit {
+            background: #000;
+            color: #00ff41;
+            font-family: 'Courier New', monospace;
+            font-size: 12px;
+            border: 1px solid #4ecdc4;
+            border-radius: 5px;
+            padding: 10px;
+        }
+    """
+    
+    _QSS_LOG_TEXTEDIT = """
+        QPlainTextEdit {
+            background: #000;
+            color: #00ff41;
+            font-family: 'Courier New', monospace;
+            font-size: 11px;
+            border: 1px solid #4ecdc4;
+            border-radius: 5px;
+            padding: 10px;
+        }
+    """
+    
+    _QSS_GSM_TEXTEDIT = """
+        QPlainTextEdit {
+            background: #1a1a2e;
+            color: #4ecdc4;
+            font-family: 'Courier New', monospace;
+            font-size: 11px;
+            border: 1px solid #4ecdc4;
+            border-radius: 5px;
+            padding: 10px;
+        }
+    """
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("🚨📱 EMF Chaos Engine - Viral $10-20M Warfare Suite")
@@ -32,21 +150,74 @@ class EMFChaosMainWindow(QMainWindow):
         # Data storage
         self.detected_phones = 8  # Current count from your system
         self.gsm_threats = 0
-        self.warfare_logs = []
+        self.warfare_logs = deque(maxlen=10000)  # Formatted "[HH:MM:SS] msg" lines
         self.chaos_intensity = 91  # Swiss Energy Disruption level
-        
-        # Setup UI components
-        self.setup_ui()
-        self.setup_styling()
-        self.setup_timers()
+        self._ts_cache = (0, '')  # (epoch second, formatted HH:MM:SS)
+        
+        # Built with the Warfare Logs tab on first visit
+        self.log_display = None
+        
+        # Log lines waiting for the next display flush
+        self._pending_logs = deque()
+        self._batch_depth = 0
+        
+        # Fonts shared by header and stats labels (QFont is implicitly
+        # shared, so handing the same instance to several labels is cheap)
+        self._font_title = QFont("Arial", 24, QFont.Weight.Bold)
+        self._font_subtitle = QFont("Arial", 14)
+        self._font_status = QFont("Arial", 12, QFont.Weight.Bold)
+        self._font_stat = QFont("Arial", 18, QFont.Weight.Bold)
+        
+        # Setup UI components - paints are held until the whole window is
+        # built so it is drawn once instead of after every addWidget
+        self.setUpdatesEnabled(False)
+        try:
+            self.setup_ui()
+            self.setup_styling()
+            self.setup_timers()
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        # Stats labels were just built from the current values
+        self._stats_dirty = False
         
         # Initialize with current status
-        self.log_message("🚨📱 EMF Chaos Engine Initialized")
-        self.log_message("🛡️ HackRF One Serial: 78d063dc2b6f6967")
-        self.log_message("📱 8 phones currently tracked")
-        self.log_message("⚡ 91% chaos intensity - Swiss Energy Disruption")
-        self.log_message("💰 Valuation: $10-20M post-viral success")
-        self.log_message("🔥 Status: What a fucking week!")
+        with self.batched_updates():
+            self.log_message("🚨📱 EMF Chaos Engine Initialized")
+            self.log_message("🛡️ HackRF One Serial: 78d063dc2b6f6967")
+            self.log_message("📱 8 phones currently tracked")
+            self.log_message("⚡ 91% chaos intensity - Swiss Energy Disruption")
+            self.log_message("💰 Valuation: $10-20M post-viral success")
+            self.log_message("🔥 Status: What a fucking week!")
+        
+    # Stats are stored as plain values; writing any of them marks the stats
+    # labels dirty so update_displays only reformats them when needed
+    @property
+    def detected_phones(self):
+        return self._detected_phones
+    
+    @detected_phones.setter
+    def detected_phones(self, value):
+        self._detected_phones = value
+        self._stats_dirty = True
+    
+    @property
+    def gsm_threats(self):
+        return self._gsm_threats
+    
+    @gsm_threats.setter
+    def gsm_threats(self, value):
+        self._gsm_threats = value
+        self._stats_dirty = True
+    
+    @property
+    def chaos_intensity(self):
+        return self._chaos_intensity
+    
+    @chaos_intensity.setter
+    def chaos_intensity(self, value):
+        self._chaos_intensity = value
+        self._stats_dirty = True
         
     def setup_ui(self):
         """Setup the main user interface"""
@@ -86,11 +257,7 @@ class EMFChaosMainWindow(QMainWindow):
         logo_label = QLabel()
         logo_path = os.path.join(os.path.dirname(__file__), "aimf_logo.png")
         if os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path)
-            # Scale logo to fit header (80x80 pixels)
-            scaled_pixmap = pixmap.scaled(80, 80, Qt.AspectRatioMode.KeepAspectRatio, 
-                                        Qt.TransformationMode.SmoothTransformation)
-            logo_label.setPixmap(scaled_pixmap)
+            logo_label.setPixmap(self.load_header_logo(logo_path))
         else:
             # Fallback to emoji if logo not found
             logo_label.setText("🚨📱")
@@ -104,17 +271,17 @@ class EMFChaosMainWindow(QMainWindow):
         title_layout = QVBoxLayout()
         
         title_label = QLabel("EMF CHAOS ENGINE")
-        title_label.setFont(QFont("Arial", 24, QFont.Weight.Bold))
+        title_label.setFont(self._font_title)
         title_label.setStyleSheet("color: white; margin: 5px;")
         title_layout.addWidget(title_label)
         
         subtitle_label = QLabel("Viral $10-20M Warfare Suite - Live HackRF Integration")
-        subtitle_label.setFont(QFont("Arial", 14))
+        subtitle_label.setFont(self._font_subtitle)
         subtitle_label.setStyleSheet("color: #f0f0f0; margin: 2px;")
         title_layout.addWidget(subtitle_label)
         
         status_label = QLabel("🛡️ OPERATIONAL - What a fucking week!")
-        status_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        status_label.setFont(self._font_status)
         status_label.setStyleSheet("color: #00ff41; margin: 2px;")
         title_layout.addWidget(status_label)
         
@@ -125,6 +292,30 @@ class EMFChaosMainWindow(QMainWindow):
         
         parent_layout.addWidget(header_frame)
         
+    def load_header_logo(self, logo_path):
+        """Load the header logo scaled to 80x80, reusing a cached copy on disk"""
+        cache_path = LOGO_CACHE_DIR / "aimf_logo_80.png"
+        
+        # Cached copy is valid as long as it is newer than the source logo
+        try:
+            if cache_path.stat().st_mtime >= os.path.getmtime(logo_path):
+                cached_pixmap = QPixmap(str(cache_path))
+                if not cached_pixmap.isNull():
+                    return cached_pixmap
+        except OSError:
+            pass
+        
+        # Scale logo to fit header (80x80 pixels)
+        pixmap = QPixmap(logo_path)
+        scaled_pixmap = pixmap.scaled(80, 80, Qt.AspectRatioMode.KeepAspectRatio, 
+                                    Qt.TransformationMode.SmoothTransformation)
+        try:
+            LOGO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            scaled_pixmap.save(str(cache_path), 'PNG')
+        except OSError:
+            pass  # Cache is best-effort; the scaled logo is still shown
+        return scaled_pixmap
+        
     def create_stats_section(self, parent_layout):
         """Create the live statistics section"""
         stats_frame = QFrame()
@@ -143,7 +334,7 @@ class EMFChaosMainWindow(QMainWindow):
         phones_layout = QHBoxLayout()
         phones_layout.addWidget(QLabel("📱 Phones:"))
         self.phones_label = QLabel(str(self.detected_phones))
-        self.phones_label.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        self.phones_label.setFont(self._font_stat)
         self.phones_label.setStyleSheet("color: #00ff41;")
         phones_layout.addWidget(self.phones_label)
         phones_layout.addStretch()
@@ -153,7 +344,7 @@ class EMFChaosMainWindow(QMainWindow):
         threats_layout = QHBoxLayout()
         threats_layout.addWidget(QLabel("🎯 Threats:"))
         self.threats_label = QLabel(str(self.gsm_threats))
-        self.threats_label.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        self.threats_label.setFont(self._font_stat)
         self.threats_label.setStyleSheet("color: #ff6b6b;")
         threats_layout.addWidget(self.threats_label)
         threats_layout.addStretch()
@@ -163,7 +354,7 @@ class EMFChaosMainWindow(QMainWindow):
         chaos_layout = QHBoxLayout()
         chaos_layout.addWidget(QLabel("⚡ Chaos:"))
         self.chaos_label = QLabel(f"{self.chaos_intensity}%")
-        self.chaos_label.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        self.chaos_label.setFont(self._font_stat)
         self.chaos_label.setStyleSheet("color: #4ecdc4;")
         chaos_layout.addWidget(self.chaos_label)
         chaos_layout.addStretch()
@@ -199,17 +390,39 @@ class EMFChaosMainWindow(QMainWindow):
             }
         """)
         
-        # Create individual tabs
-        self.create_live_detection_tab()
-        self.create_gsm_warfare_tab()
-        self.create_phone_tracking_tab()
-        self.create_warfare_logs_tab()
+        # Tabs start as empty placeholders and are filled in on first visit.
+        # Live detection is built right away - it is the visible tab and its
+        # buttons back the Warfare menu and status updates.
+        self._tab_builders = [
+            (self.create_live_detection_tab, "🎯 Live Detection"),
+            (self.create_gsm_warfare_tab, "📡 GSM Warfare"),
+            (self.create_phone_tracking_tab, "📱 Phone Tracking"),
+            (self.create_warfare_logs_tab, "📝 Warfare Logs"),
+        ]
+        self._built_tabs = set()
+        for _, title in self._tab_builders:
+            self.tab_widget.addTab(QWidget(), title)
+        
+        self._materialize_tab(0)
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
         
         parent_layout.addWidget(self.tab_widget)
         
-    def create_live_detection_tab(self):
+    def _materialize_tab(self, index):
+        """Build a tab's contents the first time it is shown"""
+        if index < 0 or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        builder, _ = self._tab_builders[index]
+        page = self.tab_widget.widget(index)
+        page.setUpdatesEnabled(False)
+        try:
+            builder(page)
+        finally:
+            page.setUpdatesEnabled(True)
+        
+    def create_live_detection_tab(self, tab):
         """Create the live detection tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Control panel
@@ -219,45 +432,14 @@ class EMFChaosMainWindow(QMainWindow):
         # Start detection button
         self.start_btn = QPushButton("🚀 START LIVE DETECTION")
         self.start_btn.setFixedHeight(50)
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background: #00ff41;
-                color: #000;
-                font-weight: bold;
-                font-size: 14px;
-                border-radius: 10px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background: #4ecdc4;
-            }
-            QPushButton:pressed {
-                background: #00cc33;
-            }
-        """)
+        self.start_btn.setStyleSheet(self._QSS_START_BUTTON)
         self.start_btn.clicked.connect(self.start_detection)
         
         # Stop detection button
         self.stop_btn = QPushButton("🛑 STOP DETECTION")
         self.stop_btn.setFixedHeight(50)
         self.stop_btn.setEnabled(False)
-        self.stop_btn.setStyleSheet("""
-            QPushButton {
-                background: #ff6b6b;
-                color: #fff;
-                font-weight: bold;
-                font-size: 14px;
-                border-radius: 10px;
-                padding: 10px;
-            }
-            QPushButton:hover {
-                background: #ff5252;
-            }
-            QPushButton:disabled {
-                background: #666;
-                color: #999;
-            }
-        """)
+        self.stop_btn.setStyleSheet(self._QSS_STOP_BUTTON)
         self.stop_btn.clicked.connect(self.stop_detection)
         
         control_layout.addWidget(self.start_btn)
@@ -270,28 +452,16 @@ class EMFChaosMainWindow(QMainWindow):
         detection_group = QGroupBox("📡 Live Detection Results")
         detection_layout = QVBoxLayout(detection_group)
         
-        self.detection_display = QTextEdit()
-        self.detection_display.setStyleSheet("""
-            QTextEdit {
-                background: #000;
-                color: #00ff41;
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-                border: 1px solid #4ecdc4;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """)
+        self.detection_display = QPlainTextEdit()
+        self.detection_display.setMaximumBlockCount(self._MAX_DISPLAY_LINES)
+        self.detection_display.setStyleSheet(self._QSS_TERMINAL_TEXTEDIT)
         self.detection_display.setPlainText("🚨📱 EMF Chaos Engine Ready\n🛡️ Awaiting warfare commands...\n")
         
         detection_layout.addWidget(self.detection_display)
         layout.addWidget(detection_group)
         
-        self.tab_widget.addTab(tab, "🎯 Live Detection")
-        
-    def create_gsm_warfare_tab(self):
+    def create_gsm_warfare_tab(self, tab):
         """Create the GSM warfare tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # GSM control panel
@@ -299,33 +469,11 @@ class EMFChaosMainWindow(QMainWindow):
         gsm_layout = QHBoxLayout(gsm_group)
         
         scan_btn = QPushButton("🔍 SCAN GSM SPECTRUM")
-        scan_btn.setStyleSheet("""
-            QPushButton {
-                background: #4ecdc4;
-                color: #000;
-                font-weight: bold;
-                padding: 10px 20px;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background: #45b7d1;
-            }
-        """)
+        scan_btn.setStyleSheet(self._QSS_TEAL_BUTTON)
         scan_btn.clicked.connect(self.start_gsm_scan)
         
         imsi_btn = QPushButton("🎯 DETECT IMSI CATCHERS")
-        imsi_btn.setStyleSheet("""
-            QPushButton {
-                background: #ff6b6b;
-                color: #fff;
-                font-weight: bold;
-                padding: 10px 20px;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background: #ff5252;
-            }
-        """)
+        imsi_btn.setStyleSheet(self._QSS_RED_BUTTON)
         imsi_btn.clicked.connect(self.detect_imsi_catchers)
         
         gsm_layout.addWidget(scan_btn)
@@ -338,46 +486,24 @@ class EMFChaosMainWindow(QMainWindow):
         gsm_results_group = QGroupBox("📊 GSM Analysis Results")
         gsm_results_layout = QVBoxLayout(gsm_results_group)
         
-        self.gsm_display = QTextEdit()
-        self.gsm_display.setStyleSheet("""
-            QTextEdit {
-                background: #1a1a2e;
-                color: #4ecdc4;
-                font-family: 'Courier New', monospace;
-                font-size: 11px;
-                border: 1px solid #4ecdc4;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """)
+        self.gsm_display = QPlainTextEdit()
+        self.gsm_display.setMaximumBlockCount(self._MAX_DISPLAY_LINES)
+        self.gsm_display.setStyleSheet(self._QSS_GSM_TEXTEDIT)
         self.gsm_display.setPlainText("📡 GSM Warfare Module Ready\n🎯 HackRF One Serial: 78d063dc2b6f6967\n🛡️ SDR Self-Filter: ACTIVE\n")
         
         gsm_results_layout.addWidget(self.gsm_display)
         layout.addWidget(gsm_results_group)
         
-        self.tab_widget.addTab(tab, "📡 GSM Warfare")
-        
-    def create_phone_tracking_tab(self):
+    def create_phone_tracking_tab(self, tab):
         """Create the phone tracking tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Phone tracking info
         tracking_group = QGroupBox("📱 Live Phone Tracking Status")
         tracking_layout = QVBoxLayout(tracking_group)
         
-        self.phone_display = QTextEdit()
-        self.phone_display.setStyleSheet("""
-            QTextEdit {
-                background: #000;
-                color: #00ff41;
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-                border: 1px solid #4ecdc4;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """)
+        self.phone_display = QPlainTextEdit()
+        self.phone_display.setStyleSheet(self._QSS_TERMINAL_TEXTEDIT)
         
         # Populate with current phone tracking data
         phone_data = """📱 LIVE PHONE TRACKING - 8 DEVICES DETECTED
@@ -403,11 +529,8 @@ Phone_008: -73dBm | EAST   | ACTIVE | Galaxy
         tracking_layout.addWidget(self.phone_display)
         layout.addWidget(tracking_group)
         
-        self.tab_widget.addTab(tab, "📱 Phone Tracking")
-        
-    def create_warfare_logs_tab(self):
+    def create_warfare_logs_tab(self, tab):
         """Create the warfare logs tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Log controls
@@ -415,27 +538,11 @@ Phone_008: -73dBm | EAST   | ACTIVE | Galaxy
         log_control_layout = QHBoxLayout(log_control_group)
         
         export_btn = QPushButton("💾 EXPORT LOGS")
-        export_btn.setStyleSheet("""
-            QPushButton {
-                background: #4ecdc4;
-                color: #000;
-                font-weight: bold;
-                padding: 10px 20px;
-                border-radius: 8px;
-            }
-        """)
+        export_btn.setStyleSheet(self._QSS_TEAL_BUTTON)
         export_btn.clicked.connect(self.export_logs)
         
         clear_btn = QPushButton("🗑️ CLEAR LOGS")
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background: #ff6b6b;
-                color: #fff;
-                font-weight: bold;
-                padding: 10px 20px;
-                border-radius: 8px;
-            }
-        """)
+        clear_btn.setStyleSheet(self._QSS_RED_BUTTON)
         clear_btn.clicked.connect(self.clear_logs)
         
         log_control_layout.addWidget(export_btn)
@@ -448,24 +555,18 @@ Phone_008: -73dBm | EAST   | ACTIVE | Galaxy
         log_group = QGroupBox("📋 Live Warfare Logs")
         log_layout = QVBoxLayout(log_group)
         
-        self.log_display = QTextEdit()
-        self.log_display.setStyleSheet("""
-            QTextEdit {
-                background: #000;
-                color: #00ff41;
-                font-family: 'Courier New', monospace;
-                font-size: 11px;
-                border: 1px solid #4ecdc4;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """)
+        # Drain the queue first - those lines are already in warfare_logs,
+        # which seeds the new display below
+        self._flush_logs()
+        
+        self.log_display = QPlainTextEdit()
+        self.log_display.setMaximumBlockCount(self._MAX_DISPLAY_LINES)
+        self.log_display.setStyleSheet(self._QSS_LOG_TEXTEDIT)
+        self.log_display.setPlainText("\n".join(self.warfare_logs))
         
         log_layout.addWidget(self.log_display)
         layout.addWidget(log_group)
         
-        self.tab_widget.addTab(tab, "📝 Warfare Logs")
-        
     def create_status_bar(self):
         """Create the status bar"""
         status_bar = QStatusBar()
@@ -548,88 +649,161 @@ Phone_008: -73dBm | EAST   | ACTIVE | Galaxy
         
     def setup_timers(self):
         """Setup update timers"""
-        # Main update timer
-        self.update_timer = QTimer()
+        # Main update timer - started/stopped by showEvent/hideEvent so it
+        # never fires while the window can't be seen
+        self.update_timer = QTimer(self)
+        self.update_timer.setInterval(self._UPDATE_INTERVAL_IDLE_MS)
         self.update_timer.timeout.connect(self.update_displays)
-        self.update_timer.start(2000)  # Update every 2 seconds
+        
+        # Log flush timer - coalesces bursts of log_message calls into one
+        # append per display
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_logs)
         
     def start_detection(self):
         """Start live detection"""
-        self.log_message("🚀 Starting live EMF Chaos Engine detection...")
-        self.log_message("📡 HackRF One initializing...")
-        self.log_message("🛡️ SDR self-filter activated")
-        self.log_message("🎯 Live GSM detection: ACTIVE")
+        with self.batched_updates():
+            self.log_message("🚀 Starting live EMF Chaos Engine detection...")
+            self.log_message("📡 HackRF One initializing...")
+            self.log_message("🛡️ SDR self-filter activated")
+            self.log_message("🎯 Live GSM detection: ACTIVE")
         
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
+        self.update_timer.setInterval(self._UPDATE_INTERVAL_ACTIVE_MS)
         
         self.statusBar().showMessage("🚀 LIVE DETECTION ACTIVE - Scanning for threats...")
         
     def stop_detection(self):
         """Stop live detection"""
-        self.log_message("🛑 Stopping live detection...")
-        self.log_message("📡 HackRF One: STANDBY")
+        with self.batched_updates():
+            self.log_message("🛑 Stopping live detection...")
+            self.log_message("📡 HackRF One: STANDBY")
         
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
+        self.update_timer.setInterval(self._UPDATE_INTERVAL_IDLE_MS)
         
         self.statusBar().showMessage("🛑 Detection stopped - EMF Chaos Engine on standby")
         
     def start_gsm_scan(self):
         """Start GSM spectrum scan"""
         self.log_message("📡 Starting GSM spectrum scan...")
-        self.gsm_display.append("🔍 Scanning GSM frequencies 850-1900 MHz...")
-        self.gsm_display.append("📊 Analyzing carrier signals...")
-        self.gsm_display.append("🎯 Checking for IMSI catcher signatures...")
+        self.gsm_display.appendPlainText("🔍 Scanning GSM frequencies 850-1900 MHz...")
+        self.gsm_display.appendPlainText("📊 Analyzing carrier signals...")
+        self.gsm_display.appendPlainText("🎯 Checking for IMSI catcher signatures...")
         
     def detect_imsi_catchers(self):
         """Detect IMSI catchers"""
         self.log_message("🎯 Scanning for IMSI catchers...")
-        self.gsm_display.append("🚨 IMSI Catcher Detection: ACTIVE")
-        self.gsm_display.append("🔍 Analyzing base station anomalies...")
-        self.gsm_display.append("✅ No IMSI catchers detected in current scan")
+        self.gsm_display.appendPlainText("🚨 IMSI Catcher Detection: ACTIVE")
+        self.gsm_display.appendPlainText("🔍 Analyzing base station anomalies...")
+        self.gsm_display.appendPlainText("✅ No IMSI catchers detected in current scan")
         
-    def export_logs(self):
+    @asyncSlot()
+    async def export_logs(self):
         """Export warfare logs"""
         self.log_message("💾 Exporting warfare logs...")
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"emf_chaos_logs_{timestamp}.txt"
+        content = "\n".join(self.warfare_logs) + "\n"
+        
+        # Write off the GUI thread so a slow disk doesn't stall repaints
+        try:
+            await asyncio.to_thread(Path(filename).write_text, content, encoding='utf-8')
+        except OSError as e:
+            self.log_message(f"❌ Log export failed: {e}")
+            return
         self.log_message(f"📄 Logs exported to: {filename}")
         
     def clear_logs(self):
         """Clear warfare logs"""
+        self._flush_logs()
         self.log_display.clear()
         self.log_message("🗑️ Warfare logs cleared")
         
+    def showEvent(self, event):
+        """Resume display updates when the window becomes visible"""
+        super().showEvent(event)
+        if not self.update_timer.isActive():
+            self.update_timer.start()
+            self.update_displays()
+        
+    def hideEvent(self, event):
+        """Pause display updates while hidden or minimized"""
+        super().hideEvent(event)
+        self.update_timer.stop()
+        
     def update_displays(self):
         """Update all displays with current data"""
-        # Update stats
-        self.phones_label.setText(str(self.detected_phones))
-        self.threats_label.setText(str(self.gsm_threats))
-        self.chaos_label.setText(f"{self.chaos_intensity}%")
+        if not self.isVisible():
+            return
+        
+        # Update stats - only touch the labels when a value was written,
+        # since every setText schedules a repaint
+        if self._stats_dirty:
+            self.phones_label.setText(str(self.detected_phones))
+            self.threats_label.setText(str(self.gsm_threats))
+            self.chaos_label.setText(f"{self.chaos_intensity}%")
+            self._stats_dirty = False
         
         # Update timestamp in status
-        current_time = datetime.now().strftime('%H:%M:%S')
         if self.stop_btn.isEnabled():
-            self.statusBar().showMessage(f"🚀 LIVE DETECTION ACTIVE - Last update: {current_time}")
+            self.statusBar().showMessage(f"🚀 LIVE DETECTION ACTIVE - Last update: {self._ts()}")
+        
+    def _ts(self):
+        """Current HH:MM:SS, re-formatted only when the second rolls over"""
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, time.strftime('%H:%M:%S', time.localtime(now)))
+        return self._ts_cache[1]
         
     def log_message(self, message):
         """Log a message to the warfare logs"""
-        timestamp = datetime.now().strftime('%H:%M:%S')
+        timestamp = self._ts()
         formatted_message = f"[{timestamp}] {message}"
         
-        # Add to log display
-        self.log_display.append(formatted_message)
-        
-        # Add to detection display if it's detection-related
-        if any(keyword in message.lower() for keyword in ['detection', 'scan', 'hackrf', 'gsm']):
-            self.detection_display.append(formatted_message)
-        
-        # Store in warfare logs
-        self.warfare_logs.append({
-            'timestamp': timestamp,
-            'message': message
-        })
+        # Queue for the displays; detection-related lines also go to the
+        # detection display when flushed
+        is_detection = self._DETECTION_RE.search(message) is not None
+        self._pending_logs.append((formatted_message, is_detection))
+        
+        # Store in warfare logs, already formatted for display and export
+        self.warfare_logs.append(formatted_message)
+        
+        if self._batch_depth == 0 and not self._flush_timer.isActive():
+            self._flush_timer.start(50)
+        
+    def _flush_logs(self):
+        """Append all pending log lines to the displays in one go"""
+        if not self._pending_logs:
+            return
+        
+        lines = []
+        detection_lines = []
+        while self._pending_logs:
+            formatted_message, is_detection = self._pending_logs.popleft()
+            lines.append(formatted_message)
+            if is_detection:
+                detection_lines.append(formatted_message)
+        
+        if self.log_display is not None:
+            self.log_display.appendPlainText("\n".join(lines))
+        if detection_lines:
+            self.detection_display.appendPlainText("\n".join(detection_lines))
+        
+    @contextmanager
+    def batched_updates(self):
+        """Hold log display updates until the outermost block exits"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_timer.stop()
+                self._flush_logs()
         
     def show_about(self):
         """Show about dialog"""
@@ -10,32 +10,36 @@ Date: August 14, 2025
 import sys
 import os
 import subprocess
+import importlib.util
 from pathlib import Path
 
+VENV_PATH = Path(__file__).parent / "emf_chaos_venv"
+BOOTSTRAP_SENTINEL = VENV_PATH / ".emf_bootstrap_ok"
+
 def check_pyqt6():
-    """Check if PyQt6 is installed"""
-    try:
-        import PyQt6
-        print("✅ PyQt6 is installed")
+    """Check if PyQt6 and the qasync event-loop bridge are installed"""
+    # find_spec locates the packages without importing them
+    missing = [name for name in ("PyQt6", "qasync") if importlib.util.find_spec(name) is None]
+    if not missing:
+        print("✅ PyQt6 and qasync are installed")
         return True
-    except ImportError:
-        print("❌ PyQt6 not found")
-        return False
+    print(f"❌ {' and '.join(missing)} not found")
+    return False
 
 def install_pyqt6():
-    """Install PyQt6 using pip3"""
-    print("🔧 Installing PyQt6...")
+    """Install PyQt6 and qasync using pip3"""
+    print("🔧 Installing PyQt6 and qasync...")
     try:
-        subprocess.run([sys.executable, "-m", "pip", "install", "PyQt6"], check=True)
-        print("✅ PyQt6 installed successfully")
+        subprocess.run([sys.executable, "-m", "pip", "install", "PyQt6", "qasync"], check=True)
+        print("✅ PyQt6 and qasync installed successfully")
         return True
     except subprocess.CalledProcessError:
-        print("❌ Failed to install PyQt6")
+        print("❌ Failed to install PyQt6 and qasync")
         return False
 
 def create_venv():
     """Create virtual environment for EMF Chaos Engine"""
-    venv_path = Path(__file__).parent / "emf_chaos_venv"
+    venv_path = VENV_PATH
     
     if venv_path.exists():
         print("✅ Virtual environment already exists")
@@ -50,22 +54,39 @@ def create_venv():
         print("❌ Failed to create virtual environment")
         return None
 
+def venv_tool_paths(venv_path):
+    """Return (pip, python) executable paths inside the virtual environment"""
+    if sys.platform == "darwin":  # macOS
+        return Path(venv_path) / "bin" / "pip3", Path(venv_path) / "bin" / "python3"
+    return Path(venv_path) / "Scripts" / "pip.exe", Path(venv_path) / "Scripts" / "python.exe"
+
+def bootstrapped_python():
+    """Return the venv python if a previous launch finished setup, else None"""
+    if not BOOTSTRAP_SENTINEL.exists():
+        return None
+    _, python_path = venv_tool_paths(VENV_PATH)
+    return str(python_path) if python_path.exists() else None
+
+def write_bootstrap_sentinel(python_path):
+    """Record a completed venv setup so later launches skip the checks"""
+    result = subprocess.run(
+        [python_path, "-c", "from importlib.metadata import version; print(version('PyQt6'))"],
+        capture_output=True, text=True
+    )
+    BOOTSTRAP_SENTINEL.write_text(f"PyQt6 {result.stdout.strip() or 'unknown'}\n")
+
 def activate_venv_and_install(venv_path):
     """Activate venv and install dependencies"""
-    if sys.platform == "darwin":  # macOS
-        pip_path = Path(venv_path) / "bin" / "pip3"
-        python_path = Path(venv_path) / "bin" / "python3"
-    else:
-        pip_path = Path(venv_path) / "Scripts" / "pip.exe"
-        python_path = Path(venv_path) / "Scripts" / "python.exe"
+    pip_path, python_path = venv_tool_paths(venv_path)
     
-    print("🔧 Installing PyQt6 in virtual environment...")
+    print("🔧 Installing PyQt6 and qasync in virtual environment...")
     try:
-        subprocess.run([str(pip_path), "install", "PyQt6"], check=True)
-        print("✅ PyQt6 installed in virtual environment")
+        subprocess.run([str(pip_path), "install", "PyQt6", "qasync"], check=True)
+        print("✅ PyQt6 and qasync installed in virtual environment")
+        write_bootstrap_sentinel(str(python_path))
         return str(python_path)
     except subprocess.CalledProcessError:
-        print("❌ Failed to install PyQt6 in virtual environment")
+        print("❌ Failed to install PyQt6 and qasync in virtual environment")
         return None
 
 def launch_app(python_path=None):
@@ -95,12 +116,19 @@ def main():
     print("🔥 What a fucking week!")
     print()
     
-    # Check if PyQt6 is available
+    # Warm launch: the venv was fully set up before, go straight to the app
+    python_path = bootstrapped_python()
+    if python_path:
+        print("✅ Virtual environment ready")
+        launch_app(python_path)
+        return
+    
+    # Check if PyQt6 and qasync are available
     if check_pyqt6():
-        # PyQt6 is available, launch directly
+        # Dependencies are available, launch directly
         launch_app()
     else:
-        print("🔧 PyQt6 not found. Setting up virtual environment...")
+        print("🔧 Setting up virtual environment...")
         
         # Create virtual environment
         venv_path = create_venv()
@@ -109,8 +137,8 @@ def main():
             if install_pyqt6():
                 launch_app()
             else:
-                print("❌ Cannot install PyQt6. Please install manually:")
-                print("   pip3 install PyQt6")
+                print("❌ Cannot install PyQt6 and qasync. Please install manually:")
+                print("   pip3 install PyQt6 qasync")
                 sys.exit(1)
         else:
             # Install in venv and launch
@@ -118,8 +146,8 @@ def main():
             if python_path:
                 launch_app(python_path)
             else:
-                print("❌ Setup failed. Please install PyQt6 manually:")
-                print("   pip3 install PyQt6")
+                print("❌ Setup failed. Please install PyQt6 and qasync manually:")
+                print("   pip3 install PyQt6 qasync")
                 sys.exit(1)
 
 if __name__ == "__main__":
@@ -16,17 +16,24 @@ import threading
 import queue
 import json
 import os
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 import signal
 import sys
 
+# Optional fast JSON encoder for log export
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class AdvancedSDRAttackExperiments:
     """Advanced SDR attack experiments using delay-based methods"""
     
     def __init__(self):
         self.hackrf_serial = "78d063dc2b6f6967"  # Your HackRF One
-        self.experiment_log = []
+        self.experiment_log = deque(maxlen=100_000)  # Oldest entries drop first
         self.is_running = False
         self.capture_queue = queue.Queue()
         self.attack_queue = queue.Queue()
@@ -320,8 +327,12 @@ class AdvancedSDRAttackExperiments:
         
         try:
             os.makedirs(os.path.dirname(log_file), exist_ok=True)
-            with open(log_file, 'w') as f:
-                json.dump(self.experiment_log, f, indent=2)
+            if orjson is not None:
+                with open(log_file, 'wb') as f:
+                    f.write(orjson.dumps(list(self.experiment_log), option=orjson.OPT_INDENT_2))
+            else:
+                with open(log_file, 'w') as f:
+                    json.dump(list(self.experiment_log), f, indent=2)
             
             print(f"📝 Experiment log exported: {log_file}")
             
@@ -8,23 +8,191 @@ Leverages HackRF One SDR and native macOS Bluetooth for comprehensive tracking p
 """
 
 import subprocess
+import sys
+import shutil
 import json
 import time
+import random
 import threading
-from datetime import datetime
+import queue
+import asyncio
+import struct
+import io
+from array import array
 from collections import defaultdict
+from dataclasses import dataclass, replace
+from typing import Optional
 import re
 
+from fast_timestamps import fast_iso
+
+# Optional vectorized parsing of HackRF sweep records
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional fast JSON decoder for system_profiler output
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional streaming JSON parser - system_profiler dumps can run to megabytes
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional vectorized multi-literal matcher for BLE names - falls back to
+# the compiled regex alternation
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Optional persistent BLE scanner - without it each scan shells out to
+# system_profiler / blueutil
+try:
+    from bleak import BleakScanner
+except ImportError:
+    BleakScanner = None
+
+# 16-bit Bluetooth SIG UUIDs expand onto this base in advertisement data
+BLE_BASE_UUID = "0000{}-0000-1000-8000-00805f9b34fb"
+
+# Every Apple device advertises company ID 0x004C; only Find My (offline
+# finding) frames, whose payload starts with type 0x12, come from trackers
+APPLE_COMPANY_ID = 0x004C
+FIND_MY_FRAME_TYPE = 0x12
+
+# hackrf_sweep -B record header: byte length of the rest of the record,
+# then the low/high band edges in Hz; float32 dB bins follow
+SWEEP_RECORD_HEADER = struct.Struct('<IQQ')
+
+# system_profiler SPBluetoothDataType device lists; each item maps a device
+# name to its properties (device_title on older macOS releases)
+BLUETOOTH_DEVICE_LISTS = ('device_title', 'device_connected', 'device_not_connected')
+BLUETOOTH_DEVICE_PREFIXES = frozenset(
+    f'SPBluetoothDataType.item.{key}.item' for key in BLUETOOTH_DEVICE_LISTS
+)
+
+# blueutil --paired line: address: aa-bb-cc-dd-ee-ff, <state>, ..., name: "<name>", ...
+BLUEUTIL_DEVICE_RE = re.compile(
+    r'^address: ([0-9a-f]{2}(?:[-:][0-9a-f]{2}){5}),.*?\bname: "([^"]*)"',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Auto-block reasons, packed into Tracker.threat_flags when it is built
+THREAT_UHF_RFID = 1 << 0
+THREAT_STRONG_SIGNAL = 1 << 1
+
+def threat_flags(reader_type, signal_strength):
+    """Threat bitfield for a new tracker - nonzero means block on sight"""
+    return ((reader_type == 'UHF_RFID') * THREAT_UHF_RFID
+            | (signal_strength > -30) * THREAT_STRONG_SIGNAL)
+
+# slots= needs Python 3.10; older interpreters get a regular dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class Tracker:
+    """Detected BLE tracker or RF reader"""
+    id: str
+    type: str
+    name: str
+    signal_strength: float
+    detection_method: str
+    timestamp: str = ''
+    threat_flags: int = 0
+    mac_address: Optional[str] = None
+    reader_type: Optional[str] = None
+    frequency: Optional[str] = None
+    
+    # Dict-style reads for UI code that indexes trackers by field name
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key, default=None):
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+# Simulated detections used when no real hardware reports anything; copied
+# with a fresh timestamp each time they are picked
+SIM_TRACKER_POOL = (
+    Tracker(
+        id='ble_airtag_sim',
+        type='airtag',
+        name='Unknown AirTag',
+        mac_address='AA:BB:CC:DD:EE:01',
+        signal_strength=-45,
+        threat_flags=0,
+        detection_method='simulation'
+    ),
+    Tracker(
+        id='ble_tile_sim',
+        type='tile',
+        name='Tile Tracker',
+        mac_address='BB:CC:DD:EE:FF:02',
+        signal_strength=-52,
+        threat_flags=0,
+        detection_method='simulation'
+    )
+)
+
+# RF readers (grey coins scenario)
+SIM_RF_READER_POOL = (
+    Tracker(
+        id='rf_uhf_915',
+        type='rf_reader',
+        name='UHF RFID Reader (Grey Coin)',
+        frequency='915MHz',
+        signal_strength=-25,
+        reader_type='UHF_RFID',
+        threat_flags=THREAT_UHF_RFID | THREAT_STRONG_SIGNAL,
+        detection_method='simulation'
+    ),
+    Tracker(
+        id='rf_wifi_2400',
+        type='rf_reader',
+        name='WiFi Tracker (Grey Coin)',
+        frequency='2.4GHz',
+        signal_strength=-18,
+        reader_type='WiFi_Tracker',
+        threat_flags=THREAT_STRONG_SIGNAL,
+        detection_method='simulation'
+    )
+)
+
 class AirTagTracker:
     """Advanced AirTag and RF tracker detection for macOS"""
     
     def __init__(self):
         self.detected_trackers = {}
         self.blocked_trackers = set()
+        self._type_counts = defaultdict(int)  # Detected trackers per type, kept in step
         self.monitoring_active = False
         self.monitor_thread = None
         self.callbacks = []
         
+        # External tools probed once - missing ones are skipped every scan
+        # instead of failing an exec each tick
+        self._has_system_profiler = shutil.which('system_profiler') is not None
+        self._has_blueutil = shutil.which('blueutil') is not None
+        self._has_hackrf = shutil.which('hackrf_info') is not None
+        
+        # Callbacks run on their own thread so a slow consumer never stalls scanning
+        self.callback_thread = None
+        self._callback_queue = queue.SimpleQueue()
+        
+        # Persistent BLE scanner state (used when bleak is installed)
+        self.ble_thread = None
+        self._ble_seen = {}
+        self._ble_seen_lock = threading.Lock()
+        
         # Tracker signatures for detection
         self.tracker_signatures = {
             'airtag': {
@@ -53,6 +221,65 @@ class AirTagTracker:
             }
         }
         
+        # Signatures never change after init - normalize them once: names to
+        # lowercase, company IDs to raw bytes, service UUIDs to the full
+        # lowercase 128-bit form advertisements report
+        for signature in self.tracker_signatures.values():
+            signature['ble_names'] = tuple(name.lower() for name in signature['ble_names'])
+            signature['manufacturer_data'] = tuple(
+                bytes.fromhex(company_id) for company_id in signature['manufacturer_data']
+            )
+            signature['service_uuids'] = tuple(
+                BLE_BASE_UUID.format(uuid.lower()) for uuid in signature['service_uuids']
+            )
+        
+        # One case-insensitive matcher per tracker type over its BLE names,
+        # tried in signature order so the first listed type still wins when a
+        # name contains several (one regex scan per type, not per name)
+        self._ble_name_patterns = [
+            (tracker_type, re.compile(
+                '|'.join(re.escape(name) for name in signature['ble_names']), re.IGNORECASE
+            ))
+            for tracker_type, signature in self.tracker_signatures.items()
+            if signature['ble_names']
+        ]
+        
+        # Same names as a Hyperscan database when available; a name's pattern
+        # ID is its tracker type's index in _hs_name_types (signature order),
+        # so the lowest matched ID is the type the regex path would pick.
+        # Scratch space is per database, so scans from the BLE and monitor
+        # threads are serialized
+        self._hs_db = None
+        self._hs_lock = threading.Lock()
+        if hyperscan is not None:
+            self._hs_name_types = [tracker_type for tracker_type, _ in self._ble_name_patterns]
+            hs_names = [
+                (re.escape(ble_name).encode(), type_index)
+                for type_index, tracker_type in enumerate(self._hs_name_types)
+                for ble_name in self.tracker_signatures[tracker_type]['ble_names']
+            ]
+            self._hs_db = hyperscan.Database()
+            self._hs_db.compile(
+                expressions=[expression for expression, _ in hs_names],
+                ids=[type_index for _, type_index in hs_names],
+                elements=len(hs_names),
+                flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+            )
+        
+        # Advertisement field lookups for the persistent BLE scanner
+        self._manufacturer_types = {}
+        self._service_uuid_types = {}
+        for tracker_type, signature in self.tracker_signatures.items():
+            company_ids = signature['manufacturer_data']
+            for index, company_id in enumerate(company_ids):
+                # Signatures also list the on-air little-endian spelling
+                # ('4c00' for 0x004C); bleak already reports the parsed ID
+                if company_id[::-1] in company_ids[:index]:
+                    continue
+                self._manufacturer_types.setdefault(int.from_bytes(company_id, 'big'), tracker_type)
+            for uuid in signature['service_uuids']:
+                self._service_uuid_types.setdefault(uuid, tracker_type)
+        
         # RF Reader signatures (like grey coins)
         self.rf_signatures = {
             'uhf_rfid': {'freq': '915MHz', 'threat': 'critical'},
@@ -62,6 +289,9 @@ class AirTagTracker:
             'ism_reader': {'freq': '433MHz', 'threat': 'medium'}
         }
         
+        if not self._has_hackrf:
+            print("⚠️ HackRF tools not installed - simulating RF detection")
+        
         print("🏷️ AirTag Tracker initialized for EMF Chaos Engine")
     
     def start_monitoring(self):
@@ -73,6 +303,15 @@ class AirTagTracker:
         print("🔍 Starting AirTag/RF tracker monitoring...")
         self.monitoring_active = True
         
+        # Start the persistent BLE scanner alongside the scan loop
+        if BleakScanner is not None:
+            self.ble_thread = threading.Thread(target=self._run_ble_scanner, daemon=True)
+            self.ble_thread.start()
+        
+        # Start callback dispatcher before anything can queue detections
+        self.callback_thread = threading.Thread(target=self._dispatch_callbacks, daemon=True)
+        self.callback_thread.start()
+        
         # Start monitoring thread
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
@@ -86,6 +325,12 @@ class AirTagTracker:
         
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
+        if self.ble_thread:
+            self.ble_thread.join(timeout=5)
+        if self.callback_thread:
+            # Sentinel wakes the dispatcher once queued events are delivered
+            self._callback_queue.put(None)
+            self.callback_thread.join(timeout=5)
         
         print("✅ AirTag monitoring stopped")
     
@@ -115,26 +360,97 @@ class AirTagTracker:
                 print(f"❌ AirTag monitoring error: {e}")
                 time.sleep(5)
     
+    def _run_ble_scanner(self):
+        """Thread entry point for the persistent BLE scanner"""
+        try:
+            asyncio.run(self._ble_scan_session())
+        except Exception as e:
+            print(f"⚠️ BLE scanner error: {e}")
+    
+    async def _ble_scan_session(self):
+        """Keep one BLE scan running for as long as monitoring is active"""
+        scanner = BleakScanner(detection_callback=self._on_ble_advertisement)
+        await scanner.start()
+        try:
+            while self.monitoring_active:
+                await asyncio.sleep(0.5)
+        finally:
+            await scanner.stop()
+    
+    def _on_ble_advertisement(self, device, advertisement_data):
+        """Record advertisements that match a tracker signature"""
+        name = advertisement_data.local_name or device.name or ''
+        tracker_type = self._identify_advertisement(
+            name, advertisement_data.manufacturer_data, advertisement_data.service_uuids
+        )
+        if not tracker_type:
+            return
+        
+        tracker = Tracker(
+            id=f"ble_{device.address.replace(':', '').replace('-', '')}",
+            type=tracker_type,
+            name=name or 'Unknown',
+            mac_address=device.address,
+            signal_strength=advertisement_data.rssi,
+            threat_flags=threat_flags(None, advertisement_data.rssi),
+            detection_method='bleak',
+            timestamp=fast_iso()
+        )
+        with self._ble_seen_lock:
+            self._ble_seen[tracker.id] = tracker
+    
+    def _identify_advertisement(self, name, manufacturer_data, service_uuids):
+        """Identify tracker type from parsed BLE advertisement fields"""
+        if name:
+            tracker_type = self._identify_tracker_type(name, None)
+            if tracker_type:
+                return tracker_type
+        
+        for uuid in service_uuids:
+            tracker_type = self._service_uuid_types.get(uuid)  # bleak reports lowercase UUIDs
+            if tracker_type:
+                return tracker_type
+        
+        for company_id, payload in manufacturer_data.items():
+            if company_id == APPLE_COMPANY_ID and payload[:1] != bytes([FIND_MY_FRAME_TYPE]):
+                continue  # iPhone, Mac, AirPods... not a tracker
+            tracker_type = self._manufacturer_types.get(company_id)
+            if tracker_type:
+                return tracker_type
+        
+        # Unlike paired devices, nameless adverts are mostly phones and
+        # accessories with rotating addresses - don't report them
+        return None
+    
     def _scan_ble_trackers(self):
         """Scan for BLE tracking devices using macOS Bluetooth"""
         trackers = []
         
+        # Persistent scanner running - just collect what it has seen
+        if self.ble_thread and self.ble_thread.is_alive():
+            with self._ble_seen_lock:
+                trackers = list(self._ble_seen.values())
+                self._ble_seen.clear()
+            
+            if not trackers:
+                trackers = self._simulate_tracker_detection()
+            return trackers
+        
         try:
             # Use system_profiler for BLE device discovery
-            cmd = ['system_profiler', 'SPBluetoothDataType', '-json']
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=15)
-            
-            if result.returncode == 0:
-                trackers.extend(self._parse_bluetooth_data(result.stdout))
+            if self._has_system_profiler:
+                cmd = ['system_profiler', 'SPBluetoothDataType', '-json']
+                result = subprocess.run(cmd, capture_output=True, timeout=15)
+                
+                if result.returncode == 0:
+                    trackers.extend(self._parse_bluetooth_data(result.stdout))
             
             # Also try blueutil if available
-            try:
+            if self._has_blueutil:
                 cmd = ['blueutil', '--paired']
                 result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
                 if result.returncode == 0:
                     trackers.extend(self._parse_blueutil_data(result.stdout))
-            except FileNotFoundError:
-                pass  # blueutil not installed
             
         except Exception as e:
             print(f"⚠️ BLE scan error: {e}")
@@ -149,51 +465,94 @@ class AirTagTracker:
         """Parse system_profiler Bluetooth JSON data"""
         trackers = []
         
+        timestamp = fast_iso()  # One timestamp per scan batch
+        
         try:
-            data = json.loads(json_data)
-            # Parse Bluetooth device data
-            # This is a simplified parser - real implementation would be more complex
+            for device in self._iter_bluetooth_devices(json_data):
+                for name, properties in device.items():
+                    if not isinstance(properties, dict):
+                        continue
+                    mac = properties.get('device_address', '')
+                    
+                    # Check if device matches tracker signatures
+                    tracker_type = self._identify_tracker_type(name, mac)
+                    if tracker_type:
+                        rssi = properties.get('device_rssi')
+                        rssi = int(rssi) if rssi is not None else -50
+                        trackers.append(Tracker(
+                            id=f"ble_{mac.replace(':', '')}",
+                            type=tracker_type,
+                            name=name,
+                            mac_address=mac,
+                            signal_strength=rssi,
+                            threat_flags=threat_flags(None, rssi),
+                            detection_method='system_profiler',
+                            timestamp=timestamp
+                        ))
             
         except Exception as e:
             print(f"⚠️ Bluetooth data parsing error: {e}")
         
         return trackers
     
+    def _iter_bluetooth_devices(self, json_data):
+        """Yield each device entry from system_profiler JSON one at a time"""
+        if ijson is None:
+            data = orjson.loads(json_data) if orjson is not None else json.loads(json_data)
+            for controller in data.get('SPBluetoothDataType', []):
+                for key in BLUETOOTH_DEVICE_LISTS:
+                    yield from controller.get(key, [])
+            return
+        
+        # Build only the device items from the event stream - the rest of the
+        # dump is never materialized
+        builder = None
+        for prefix, event, value in ijson.parse(io.BytesIO(json_data)):
+            if builder is not None:
+                builder.event(event, value)
+                if event == 'end_map' and prefix in BLUETOOTH_DEVICE_PREFIXES:
+                    yield builder.value
+                    builder = None
+            elif event == 'start_map' and prefix in BLUETOOTH_DEVICE_PREFIXES:
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+    
     def _parse_blueutil_data(self, output):
         """Parse blueutil output for paired devices"""
         trackers = []
+        timestamp = fast_iso()  # One timestamp per scan batch
         
-        lines = output.strip().split('\n')
-        for line in lines:
-            if line.strip():
-                # Parse blueutil format: address: name
-                parts = line.split(':', 1)
-                if len(parts) == 2:
-                    mac = parts[0].strip()
-                    name = parts[1].strip()
-                    
-                    # Check if device matches tracker signatures
-                    tracker_type = self._identify_tracker_type(name, mac)
-                    if tracker_type:
-                        trackers.append({
-                            'id': f"ble_{mac.replace(':', '')}",
-                            'type': tracker_type,
-                            'name': name,
-                            'mac_address': mac,
-                            'signal_strength': -50,  # Estimated
-                            'detection_method': 'blueutil',
-                            'timestamp': datetime.now().isoformat()
-                        })
+        # One scan over the whole output; the pattern validates the address
+        for match in BLUEUTIL_DEVICE_RE.finditer(output):
+            mac = match.group(1).replace('-', ':').upper()
+            name = match.group(2)
+            
+            # Check if device matches tracker signatures
+            tracker_type = self._identify_tracker_type(name, mac)
+            if tracker_type:
+                trackers.append(Tracker(
+                    id=f"ble_{mac.replace(':', '')}",
+                    type=tracker_type,
+                    name=name,
+                    mac_address=mac,
+                    signal_strength=-50,  # Estimated
+                    threat_flags=0,
+                    detection_method='blueutil',
+                    timestamp=timestamp
+                ))
         
         return trackers
     
     def _identify_tracker_type(self, name, mac):
         """Identify tracker type from name and MAC"""
-        name_lower = name.lower()
-        
-        for tracker_type, signature in self.tracker_signatures.items():
-            for ble_name in signature['ble_names']:
-                if ble_name.lower() in name_lower:
+        if self._hs_db is not None:
+            if name:
+                tracker_type = self._hs_match_name(name)
+                if tracker_type:
+                    return tracker_type
+        else:
+            for tracker_type, pattern in self._ble_name_patterns:
+                if pattern.search(name):
                     return tracker_type
         
         # Check for suspicious unnamed devices
@@ -202,10 +561,28 @@ class AirTagTracker:
         
         return None
     
+    def _hs_match_name(self, name):
+        """Return the highest-priority tracker type whose BLE name Hyperscan finds in name"""
+        found = []
+        
+        def on_match(pattern_id, start, end, flags, context):
+            # Matches arrive in end-offset order, not priority order, so
+            # collect every type index and pick the lowest afterwards
+            found.append(pattern_id)
+        
+        with self._hs_lock:
+            self._hs_db.scan(name.encode('utf-8'), match_event_handler=on_match)
+        
+        return self._hs_name_types[min(found)] if found else None
+    
     def _scan_rf_readers(self):
         """Scan for RF readers using HackRF One"""
         readers = []
         
+        if not self._has_hackrf:
+            # Probed once in __init__ - no exec attempt per scan
+            return self._simulate_rf_reader_detection()
+        
         try:
             # Check if HackRF One is available
             cmd = ['hackrf_info']
@@ -218,9 +595,6 @@ class AirTagTracker:
                 print("⚠️ HackRF One not available - using simulation")
                 readers = self._simulate_rf_reader_detection()
                 
-        except FileNotFoundError:
-            print("⚠️ HackRF tools not installed - simulating RF detection")
-            readers = self._simulate_rf_reader_detection()
         except Exception as e:
             print(f"⚠️ RF scan error: {e}")
             readers = self._simulate_rf_reader_detection()
@@ -247,26 +621,30 @@ class AirTagTracker:
                     '-f', f"{freq_mhz-5}:{freq_mhz+5}",
                     '-w', '10000',  # 10kHz bins
                     '-l', '32',     # 32 samples
-                    '-g', '20'      # 20dB gain
+                    '-g', '20',     # 20dB gain
+                    '-1',           # Single sweep, then exit
+                    '-B'            # Binary records instead of CSV text
                 ]
                 
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+                result = subprocess.run(cmd, capture_output=True, timeout=5)
                 
                 if result.returncode == 0:
                     # Parse spectrum data for strong signals
                     strong_signals = self._parse_hackrf_output(result.stdout, freq_mhz)
+                    timestamp = fast_iso()  # One per sweep
                     
                     for signal in strong_signals:
-                        readers.append({
-                            'id': f"rf_{reader_type}_{freq_mhz}",
-                            'type': 'rf_reader',
-                            'name': f"RF Reader ({reader_type})",
-                            'frequency': f"{freq_mhz}MHz",
-                            'signal_strength': signal['power'],
-                            'reader_type': reader_type,
-                            'detection_method': 'hackrf_sweep',
-                            'timestamp': datetime.now().isoformat()
-                        })
+                        readers.append(Tracker(
+                            id=f"rf_{reader_type}_{freq_mhz}",
+                            type='rf_reader',
+                            name=f"RF Reader ({reader_type})",
+                            frequency=f"{freq_mhz}MHz",
+                            signal_strength=signal['power'],
+                            reader_type=reader_type,
+                            threat_flags=threat_flags(reader_type, signal['power']),
+                            detection_method='hackrf_sweep',
+                            timestamp=timestamp
+                        ))
                 
             except Exception as e:
                 print(f"⚠️ HackRF sweep error at {freq_mhz}MHz: {e}")
@@ -274,26 +652,55 @@ class AirTagTracker:
         return readers
     
     def _parse_hackrf_output(self, output, center_freq):
-        """Parse HackRF sweep output for strong signals"""
+        """Parse binary HackRF sweep records for strong signals"""
         strong_signals = []
         
-        lines = output.strip().split('\n')
-        for line in lines:
-            if line.startswith('2025'):  # Timestamp line
-                parts = line.split(', ')
-                if len(parts) >= 6:
-                    try:
-                        freq_hz = int(parts[2])
-                        power_db = float(parts[5])
-                        
-                        # Look for signals above -40dBm (strong)
-                        if power_db > -40:
-                            strong_signals.append({
-                                'frequency': freq_hz,
-                                'power': power_db
-                            })
-                    except (ValueError, IndexError):
-                        continue
+        if len(output) < SWEEP_RECORD_HEADER.size:
+            return strong_signals
+        
+        # Every record in one sweep has the same number of bins
+        record_length = SWEEP_RECORD_HEADER.unpack_from(output)[0]
+        num_bins = (record_length - 16) // 4
+        record_size = 4 + record_length
+        num_records = len(output) // record_size
+        if num_bins <= 0 or num_records == 0:
+            return strong_signals
+        
+        if np is not None:
+            # View the whole buffer as records and threshold every bin at once
+            records = np.frombuffer(output, count=num_records, dtype=np.dtype([
+                ('length', '<u4'),
+                ('freq_low', '<u8'),
+                ('freq_high', '<u8'),
+                ('power', '<f4', (num_bins,))
+            ]))
+            # Look for signals above -40dBm (strong)
+            rows, bins = np.nonzero(records['power'] > -40)
+            freq_low = records['freq_low'][rows]
+            bin_width = (records['freq_high'][rows] - freq_low) / num_bins
+            freqs = freq_low + bins * bin_width
+            powers = records['power'][rows, bins]
+            
+            for freq_hz, power_db in zip(freqs.tolist(), powers.tolist()):
+                strong_signals.append({
+                    'frequency': int(freq_hz),
+                    'power': power_db
+                })
+            return strong_signals
+        
+        for offset in range(0, num_records * record_size, record_size):
+            _, freq_low, freq_high = SWEEP_RECORD_HEADER.unpack_from(output, offset)
+            bins_start = offset + SWEEP_RECORD_HEADER.size
+            powers = array('f', output[bins_start:bins_start + num_bins * 4])
+            bin_width = (freq_high - freq_low) / num_bins
+            
+            for index, power_db in enumerate(powers):
+                # Look for signals above -40dBm (strong)
+                if power_db > -40:
+                    strong_signals.append({
+                        'frequency': int(freq_low + index * bin_width),
+                        'power': power_db
+                    })
         
         return strong_signals
     
@@ -302,31 +709,14 @@ class AirTagTracker:
         simulated_trackers = []
         
         # Occasionally simulate finding trackers
-        if time.time() % 30 < 10:  # 1/3 of the time
-            trackers = [
-                {
-                    'id': 'ble_airtag_sim',
-                    'type': 'airtag',
-                    'name': 'Unknown AirTag',
-                    'mac_address': 'AA:BB:CC:DD:EE:01',
-                    'signal_strength': -45,
-                    'detection_method': 'simulation',
-                    'timestamp': datetime.now().isoformat()
-                },
-                {
-                    'id': 'ble_tile_sim',
-                    'type': 'tile',
-                    'name': 'Tile Tracker',
-                    'mac_address': 'BB:CC:DD:EE:FF:02',
-                    'signal_strength': -52,
-                    'detection_method': 'simulation',
-                    'timestamp': datetime.now().isoformat()
-                }
-            ]
+        if random.random() < 1 / 3:
+            timestamp = fast_iso()
             
             # Randomly select 0-2 trackers
-            import random
-            simulated_trackers = random.sample(trackers, random.randint(0, 2))
+            simulated_trackers = [
+                replace(template, timestamp=timestamp)
+                for template in random.sample(SIM_TRACKER_POOL, random.randint(0, 2))
+            ]
         
         return simulated_trackers
     
@@ -335,32 +725,12 @@ class AirTagTracker:
         readers = []
         
         # Simulate finding RF readers occasionally
-        if time.time() % 45 < 15:  # 1/3 of the time
-            grey_coins = [
-                {
-                    'id': 'rf_uhf_915',
-                    'type': 'rf_reader',
-                    'name': 'UHF RFID Reader (Grey Coin)',
-                    'frequency': '915MHz',
-                    'signal_strength': -25,
-                    'reader_type': 'UHF_RFID',
-                    'detection_method': 'simulation',
-                    'timestamp': datetime.now().isoformat()
-                },
-                {
-                    'id': 'rf_wifi_2400',
-                    'type': 'rf_reader',
-                    'name': 'WiFi Tracker (Grey Coin)',
-                    'frequency': '2.4GHz',
-                    'signal_strength': -18,
-                    'reader_type': 'WiFi_Tracker',
-                    'detection_method': 'simulation',
-                    'timestamp': datetime.now().isoformat()
-                }
+        if random.random() < 1 / 3:
+            timestamp = fast_iso()
+            readers = [
+                replace(template, timestamp=timestamp)
+                for template in random.sample(SIM_RF_READER_POOL, random.randint(0, 2))
             ]
-            
-            import random
-            readers = random.sample(grey_coins, random.randint(0, 2))
         
         return readers
     
@@ -369,25 +739,39 @@ class AirTagTracker:
         new_detections = []
         
         for tracker in trackers:
-            tracker_id = tracker['id']
+            tracker_id = tracker.id
             
             # Update or add tracker
-            if tracker_id not in self.detected_trackers:
+            is_new = tracker_id not in self.detected_trackers
+            if is_new:
                 new_detections.append(tracker)
-                print(f"🚨 NEW TRACKER DETECTED: {tracker['name']} ({tracker['type']})")
-                
-                # Auto-block critical threats
-                if tracker.get('reader_type') == 'UHF_RFID' or tracker.get('signal_strength', -100) > -30:
-                    self.block_tracker(tracker_id)
+                print(f"🚨 NEW TRACKER DETECTED: {tracker.name} ({tracker.type})")
+            else:
+                self._type_counts[self.detected_trackers[tracker_id].type] -= 1
             
             self.detected_trackers[tracker_id] = tracker
+            self._type_counts[tracker.type] += 1
+            
+            # Auto-block critical threats - block_tracker only knows stored trackers
+            if is_new and tracker.threat_flags:
+                self.block_tracker(tracker_id)
         
-        # Notify callbacks of new detections
-        for callback in self.callbacks:
-            try:
-                callback(new_detections, self.get_tracker_stats())
-            except Exception as e:
-                print(f"⚠️ Callback error: {e}")
+        # Hand new detections to the callback thread with a stats snapshot
+        self._callback_queue.put((new_detections, self.get_tracker_stats()))
+    
+    def _dispatch_callbacks(self):
+        """Deliver queued detection events to registered callbacks"""
+        while True:
+            event = self._callback_queue.get()
+            if event is None:
+                break
+            
+            new_detections, stats = event
+            for callback in self.callbacks:
+                try:
+                    callback(new_detections, stats)
+                except Exception as e:
+                    print(f"⚠️ Callback error: {e}")
     
     def block_tracker(self, tracker_id):
         """Block specific tracker"""
@@ -395,7 +779,7 @@ class AirTagTracker:
             tracker = self.detected_trackers[tracker_id]
             self.blocked_trackers.add(tracker_id)
             
-            print(f"🚫 BLOCKING TRACKER: {tracker['name']}")
+            print(f"🚫 BLOCKING TRACKER: {tracker.name}")
             
             # Real implementation would:
             # 1. Add MAC to Bluetooth blacklist
@@ -411,15 +795,18 @@ class AirTagTracker:
     
     def get_tracker_stats(self):
         """Get tracker statistics"""
-        trackers = list(self.detected_trackers.values())
+        # Counts are maintained as trackers are added; blocked_trackers only
+        # ever holds detected IDs, so active threats is a subtraction
+        total = len(self.detected_trackers)
+        blocked = len(self.blocked_trackers)
         
         return {
-            'total_detected': len(trackers),
-            'airtags': len([t for t in trackers if t['type'] == 'airtag']),
-            'tiles': len([t for t in trackers if t['type'] == 'tile']),
-            'rf_readers': len([t for t in trackers if t['type'] == 'rf_reader']),
-            'blocked': len(self.blocked_trackers),
-            'active_threats': len([t for t in trackers if t['id'] not in self.blocked_trackers])
+            'total_detected': total,
+            'airtags': self._type_counts['airtag'],
+            'tiles': self._type_counts['tile'],
+            'rf_readers': self._type_counts['rf_reader'],
+            'blocked': blocked,
+            'active_threats': total - blocked
         }
     
     def add_callback(self, callback):
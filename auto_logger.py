@@ -19,10 +19,32 @@ import json
 import time
 import threading
 from datetime import datetime
+from collections import Counter, deque
 from typing import Dict, List, Any
-import subprocess
 import re
 
+from fast_timestamps import fast_iso
+
+# Optional fast JSON encoder - falls back to the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _jsonl_line(record) -> bytes:
+        """Encode one record as a JSON Lines row"""
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+else:
+    def _jsonl_line(record) -> bytes:
+        """Encode one record as a JSON Lines row"""
+        return (json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8')
+
+# EMF Chaos Engine output patterns, compiled once at import
+_PHONE_RE = re.compile(r'📱 (.*?): (.*?) \((.*?)\) (.*?) (.*?)m (.*?) → (.*)')
+_CHAOS_RE = re.compile(r'🌪️ Chaos Pattern: (.*?) \| Intensity: (.*?)% \| Phones: (.*)')
+_GSM_RE = re.compile(r'🔍 Scanning (.*?) band: (.*?)-(.*?) MHz')
+
 class EMFAutoLogger:
     """Automated logging system for EMF Chaos Engine warfare data"""
     
@@ -31,16 +53,44 @@ class EMFAutoLogger:
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.setup_logging_directory()
         
-        # Log files
-        self.phone_log = os.path.join(self.log_dir, f"phone_detection_{self.session_id}.json")
-        self.gsm_log = os.path.join(self.log_dir, f"gsm_warfare_{self.session_id}.json")
-        self.chaos_log = os.path.join(self.log_dir, f"chaos_patterns_{self.session_id}.json")
+        # Log files (JSON Lines - one record per line, appended as it arrives)
+        self.phone_log = os.path.join(self.log_dir, f"phone_detection_{self.session_id}.jsonl")
+        self.gsm_log = os.path.join(self.log_dir, f"gsm_warfare_{self.session_id}.jsonl")
+        self.chaos_log = os.path.join(self.log_dir, f"chaos_patterns_{self.session_id}.jsonl")
         self.summary_log = os.path.join(self.log_dir, f"warfare_summary_{self.session_id}.md")
         
-        # Data storage
-        self.phone_detections = []
-        self.gsm_detections = []
-        self.chaos_patterns = []
+        # Data storage - a bounded window of recent records for the summary;
+        # every record still reaches its JSON Lines file
+        self.max_records = 100_000
+        self.phone_detections = deque(maxlen=self.max_records)
+        self.gsm_detections = deque(maxlen=self.max_records)
+        self.chaos_patterns = deque(maxlen=self.max_records)
+        
+        # Session totals and aggregates, which outlive the in-memory window;
+        # kept up to date by the parse_* methods so the summary never walks
+        # the deques while the parsing thread appends to them
+        self.phone_total = 0
+        self.gsm_total = 0
+        self.chaos_total = 0
+        self.device_type_counts = Counter()
+        self.latest_pattern_type = None
+        self.peak_intensity = 0
+        self.max_phone_count = 0
+        self.bands_scanned = set()
+        
+        # Append state: open file handles and records parsed since the last
+        # save, drained so a save only writes what is new
+        self._log_handles = {}
+        self._phone_pending = deque()
+        self._gsm_pending = deque()
+        self._chaos_pending = deque()
+        self._save_lock = threading.Lock()  # save_logs runs from two threads
+        
+        # Saves are skipped until something new is parsed, but the summary is
+        # still refreshed at least every max_save_interval seconds
+        self._dirty = False
+        self._last_save_ts = 0.0
+        self.max_save_interval = 30  # seconds
         
         # Logging flags
         self.logging_active = True
@@ -69,12 +119,11 @@ class EMFAutoLogger:
         """Parse phone detection data from EMF Chaos Engine output"""
         try:
             # Extract phone detection pattern
-            phone_pattern = r'📱 (.*?): (.*?) \((.*?)\) (.*?) (.*?)m (.*?) → (.*)'
-            match = re.search(phone_pattern, log_line)
+            match = _PHONE_RE.search(log_line)
             
             if match:
                 detection = {
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': fast_iso(),
                     'device_type': match.group(1),
                     'device_id': match.group(2),
                     'signal_strength': match.group(3),
@@ -85,6 +134,10 @@ class EMFAutoLogger:
                 }
                 
                 self.phone_detections.append(detection)
+                self._phone_pending.append(detection)
+                self.phone_total += 1
+                self.device_type_counts[detection['device_type']] += 1
+                self._dirty = True
                 return detection
                 
         except Exception as e:
@@ -96,18 +149,23 @@ class EMFAutoLogger:
         """Parse chaos pattern data"""
         try:
             # Extract chaos pattern
-            chaos_pattern = r'🌪️ Chaos Pattern: (.*?) \| Intensity: (.*?)% \| Phones: (.*)'
-            match = re.search(chaos_pattern, log_line)
+            match = _CHAOS_RE.search(log_line)
             
             if match:
                 pattern = {
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': fast_iso(),
                     'pattern_type': match.group(1),
                     'intensity': int(match.group(2)),
                     'phone_count': int(match.group(3))
                 }
                 
                 self.chaos_patterns.append(pattern)
+                self._chaos_pending.append(pattern)
+                self.chaos_total += 1
+                self.latest_pattern_type = pattern['pattern_type']
+                self.peak_intensity = max(self.peak_intensity, pattern['intensity'])
+                self.max_phone_count = max(self.max_phone_count, pattern['phone_count'])
+                self._dirty = True
                 return pattern
                 
         except Exception as e:
@@ -119,12 +177,11 @@ class EMFAutoLogger:
         """Parse GSM warfare data"""
         try:
             # Extract GSM band scanning
-            gsm_pattern = r'🔍 Scanning (.*?) band: (.*?)-(.*?) MHz'
-            match = re.search(gsm_pattern, log_line)
+            match = _GSM_RE.search(log_line)
             
             if match:
                 gsm_data = {
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': fast_iso(),
                     'band': match.group(1),
                     'start_freq': match.group(2),
                     'end_freq': match.group(3),
@@ -132,6 +189,10 @@ class EMFAutoLogger:
                 }
                 
                 self.gsm_detections.append(gsm_data)
+                self._gsm_pending.append(gsm_data)
+                self.gsm_total += 1
+                self.bands_scanned.add(gsm_data['band'])
+                self._dirty = True
                 return gsm_data
                 
         except Exception as e:
@@ -139,25 +200,61 @@ class EMFAutoLogger:
         
         return None
     
-    def save_logs(self):
+    def parse_line(self, log_line):
+        """Parse one output line with the only parser whose marker it contains"""
+        # Marker checks are plain substring tests, so at most one regex runs
+        if '📱 ' in log_line:
+            return self.parse_phone_detection(log_line)
+        if '🌪️ Chaos Pattern: ' in log_line:
+            return self.parse_chaos_pattern(log_line)
+        if '🔍 Scanning ' in log_line:
+            return self.parse_gsm_detection(log_line)
+        return None
+    
+    def _append_jsonl(self, log_file, pending):
+        """Drain pending records onto the end of a JSON Lines log"""
+        if not pending:
+            return
+        
+        handle = self._log_handles.get(log_file)
+        if handle is None:
+            handle = open(log_file, 'ab', buffering=1 << 16)
+            self._log_handles[log_file] = handle
+        
+        # popleft is thread-safe against the parser's append, so records
+        # parsed mid-save are either written now or left for the next save
+        while pending:
+            handle.write(_jsonl_line(pending.popleft()))
+        handle.flush()
+    
+    def _close_log_files(self):
+        """Close any open JSON Lines log handles"""
+        for handle in self._log_handles.values():
+            handle.close()
+        self._log_handles.clear()
+    
+    def save_logs(self, force=False):
         """Save all collected data to files"""
+        now = time.monotonic()
+        if not (force or self._dirty or now - self._last_save_ts >= self.max_save_interval):
+            return
+        
         try:
-            # Save phone detections
-            with open(self.phone_log, 'w') as f:
-                json.dump(self.phone_detections, f, indent=2)
-            
-            # Save GSM detections
-            with open(self.gsm_log, 'w') as f:
-                json.dump(self.gsm_detections, f, indent=2)
-            
-            # Save chaos patterns
-            with open(self.chaos_log, 'w') as f:
-                json.dump(self.chaos_patterns, f, indent=2)
-            
-            # Generate summary
-            self.generate_summary()
+            with self._save_lock:
+                # Cleared before the appends so records parsed mid-save mark
+                # the next save dirty again
+                self._dirty = False
+                self._last_save_ts = now
+                
+                # Append new phone detections, GSM detections and chaos patterns
+                self._append_jsonl(self.phone_log, self._phone_pending)
+                self._append_jsonl(self.gsm_log, self._gsm_pending)
+                self._append_jsonl(self.chaos_log, self._chaos_pending)
+                
+                # Generate summary
+                self.generate_summary()
             
-            print(f"💾 Logs saved - Phones: {len(self.phone_detections)}, GSM: {len(self.gsm_detections)}, Chaos: {len(self.chaos_patterns)}")
+            print(f"💾 Logs saved - Phones: {self.phone_total}, GSM: {self.gsm_total}, Chaos: {self.chaos_total}")
             
         except Exception as e:
             print(f"❌ Log save error: {e}")
@@ -165,43 +262,51 @@ class EMFAutoLogger:
     def generate_summary(self):
         """Generate markdown summary of warfare session"""
         try:
-            with open(self.summary_log, 'w') as f:
-                f.write(f"# EMF Chaos Engine Warfare Session Summary\n")
-                f.write(f"**Session ID**: {self.session_id}\n")
-                f.write(f"**Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"**AIMF LLC - EMF Chaos Engine**\n\n")
-                
-                f.write(f"## 📊 Detection Statistics\n")
-                f.write(f"- **Phone Detections**: {len(self.phone_detections)}\n")
-                f.write(f"- **GSM Band Scans**: {len(self.gsm_detections)}\n")
-                f.write(f"- **Chaos Patterns**: {len(self.chaos_patterns)}\n\n")
-                
-                if self.phone_detections:
-                    f.write(f"## 📱 Phone Detection Summary\n")
-                    device_types = {}
-                    for detection in self.phone_detections:
-                        device_type = detection['device_type']
-                        device_types[device_type] = device_types.get(device_type, 0) + 1
-                    
-                    for device, count in device_types.items():
-                        f.write(f"- **{device}**: {count} detections\n")
-                    f.write(f"\n")
-                
-                if self.chaos_patterns:
-                    f.write(f"## 🌪️ Chaos Pattern Analysis\n")
-                    latest_pattern = self.chaos_patterns[-1]
-                    f.write(f"- **Latest Pattern**: {latest_pattern['pattern_type']}\n")
-                    f.write(f"- **Peak Intensity**: {max([p['intensity'] for p in self.chaos_patterns])}%\n")
-                    f.write(f"- **Max Phone Count**: {max([p['phone_count'] for p in self.chaos_patterns])}\n\n")
+            # Snapshot the running aggregates; the parsing thread may be
+            # updating them while the summary is written
+            device_types = dict(self.device_type_counts)
+            
+            # Build the whole report first so a failure never leaves the
+            # summary file truncated
+            lines = [
+                f"# EMF Chaos Engine Warfare Session Summary\n",
+                f"**Session ID**: {self.session_id}\n",
+                f"**Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+                f"**AIMF LLC - EMF Chaos Engine**\n\n",
                 
-                f.write(f"## 📡 GSM Warfare Status\n")
-                f.write(f"- **HackRF One**: Serial 78d063dc2b6f6967\n")
-                f.write(f"- **Bands Scanned**: {len(set([g['band'] for g in self.gsm_detections]))}\n")
-                f.write(f"- **Total Scans**: {len(self.gsm_detections)}\n\n")
+                f"## 📊 Detection Statistics\n",
+                f"- **Phone Detections**: {self.phone_total}\n",
+                f"- **GSM Band Scans**: {self.gsm_total}\n",
+                f"- **Chaos Patterns**: {self.chaos_total}\n\n",
+            ]
+            
+            if device_types:
+                lines.append(f"## 📱 Phone Detection Summary\n")
+                for device, count in device_types.items():
+                    lines.append(f"- **{device}**: {count} detections\n")
+                lines.append(f"\n")
+            
+            if self.latest_pattern_type is not None:
+                lines += [
+                    f"## 🌪️ Chaos Pattern Analysis\n",
+                    f"- **Latest Pattern**: {self.latest_pattern_type}\n",
+                    f"- **Peak Intensity**: {self.peak_intensity}%\n",
+                    f"- **Max Phone Count**: {self.max_phone_count}\n\n",
+                ]
+            
+            lines += [
+                f"## 📡 GSM Warfare Status\n",
+                f"- **HackRF One**: Serial 78d063dc2b6f6967\n",
+                f"- **Bands Scanned**: {len(self.bands_scanned)}\n",
+                f"- **Total Scans**: {self.gsm_total}\n\n",
                 
-                f.write(f"---\n")
-                f.write(f"*Generated by EMF Chaos Engine Auto-Logger*\n")
-                f.write(f"*AIMF LLC - $10-20M Viral Warfare Suite*\n")
+                f"---\n",
+                f"*Generated by EMF Chaos Engine Auto-Logger*\n",
+                f"*AIMF LLC - $10-20M Viral Warfare Suite*\n",
+            ]
+            
+            with open(self.summary_log, 'w') as f:
+                f.writelines(lines)
             
         except Exception as e:
             print(f"❌ Summary generation error: {e}")
@@ -212,16 +317,6 @@ class EMFAutoLogger:
         
         while self.logging_active:
             try:
-                # Get command output
-                result = subprocess.run([
-                    'python3', '-c', 
-                    f"""
-import subprocess
-result = subprocess.run(['ps', 'aux'], capture_output=True, text=True)
-print("EMF monitoring active")
-"""
-                ], capture_output=True, text=True, timeout=5)
-                
                 # Parse and save data
                 self.save_logs()
                 
@@ -244,7 +339,9 @@ print("EMF monitoring active")
     def stop_logging(self):
         """Stop automated logging"""
         self.logging_active = False
-        self.save_logs()
+        self.save_logs(force=True)
+        with self._save_lock:
+            self._close_log_files()
         print(f"🛑 Auto-logging stopped - Final save completed")
 
 if __name__ == "__main__":
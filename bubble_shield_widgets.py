@@ -7,19 +7,105 @@ Advanced 3D visualization and directional controls for bubble shield mapping
 import sys
 import math
 import random
+from functools import partial
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QSlider, QSpinBox, QComboBox, QGroupBox, QGridLayout
+    QWidget, QVBoxLayout, QLabel, QPushButton, 
+    QSlider, QSpinBox, QGroupBox, QGridLayout
 )
-from PyQt6.QtCore import QThread, pyqtSignal, QTimer, Qt
-from PyQt6.QtGui import QFont, QPalette, QColor, QPainter, QPen, QBrush
+from PyQt6.QtCore import pyqtSignal, QTimer, Qt, QRect, QRectF, QPointF
+from PyQt6.QtGui import QFont, QColor, QPainter, QPen, QBrush, QPixmap, QPicture, QPainterPath, QPolygonF, QRegion
+
+# Screen angles (degrees, y down) for detection zones and compass directions;
+# 'center' zone devices follow the widget's current direction instead
+ZONE_ANGLES = {
+    'north': 270,
+    'south': 90,
+    'east': 0,
+    'west': 180
+}
+
+# (direction, angle, cos, sin) for the four horizontal range indicators
+DIRECTION_VECTORS = tuple(
+    (direction, angle, math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+    for direction, angle in ZONE_ANGLES.items()
+)
+
+# Sample device fields for the map before real detections arrive
+SAMPLE_ZONES = ('north', 'south', 'east', 'west', 'center')
+SAMPLE_PHONE_TYPES = ('iPhone', 'Android', 'Samsung', 'Google Pixel')
+SAMPLE_THREAT_LEVELS = ('low', 'medium', 'high', 'critical')
+SAMPLE_SIGNALS = range(-80, -29)  # -80 to -30 dBm inclusive
+
+def _marker_style(color, size):
+    """Outline pen, fill brush and radius for a device marker"""
+    return QPen(color, 2), QBrush(color), size
+
+# Device marker style per threat level; unknown levels draw as low
+THREAT_STYLES = {
+    'critical': _marker_style(QColor(255, 0, 0), 8),    # Red
+    'high': _marker_style(QColor(255, 165, 0), 6),      # Orange
+    'medium': _marker_style(QColor(255, 255, 0), 5),    # Yellow
+    'low': _marker_style(QColor(0, 255, 0), 4)          # Green
+}
 
 class DirectionalBubbleWidget(QWidget):
     """3D Directional Bubble Shield Map Widget"""
     
+    # Top-left block written by draw_shield_status
+    _STATUS_RECT = QRect(0, 0, 260, 90)
+    
+    # Paint state built once for every instance and paint
+    _PEN_GRID = QPen(QColor(0, 50, 0), 1)
+    _PEN_SHIELD_ACTIVE = QPen(QColor(0, 255, 0), 3)
+    _BRUSH_SHIELD_ACTIVE = QBrush(QColor(0, 255, 0, 20))
+    _PEN_SHIELD_INACTIVE = QPen(QColor(255, 0, 0), 3)
+    _BRUSH_SHIELD_INACTIVE = QBrush(QColor(255, 0, 0, 20))
+    _PEN_CORE = QPen(QColor(255, 255, 0), 2)
+    _PEN_RINGS = QPen(QColor(0, 150, 0), 1)
+    _PEN_ARROW = QPen(QColor(255, 255, 0), 3)
+    _PEN_TEXT = QPen(QColor(255, 255, 255), 1)
+    _PEN_RANGE_LINES = QPen(QColor(255, 255, 0, 100), 2)
+    _PEN_RANGE_ARCS = QPen(QColor(255, 255, 0, 80), 1)
+    _PEN_VERTICAL = QPen(QColor(0, 255, 255, 100), 2)
+    
     def __init__(self):
         super().__init__()
         self.devices = []
+        # Per-device fields split out of self.devices once per update
+        # (struct-of-arrays), so layout never touches the device dicts
+        self._device_zone_angles = ()  # None for 'center' (follows direction)
+        self._device_radii = ()
+        self._device_threats = ()
+        self._device_infos = ()
+        self._jitter = ()  # Per-device angle offset, fixed while the list is current
+        # Screen-space device markers, laid out once per device list and
+        # center/direction instead of on every paint
+        self._device_markers = {}
+        self._device_labels = []
+        self._device_layout_key = None
+        # Static grid rasterized once per widget size
+        self._grid_cache = None
+        self._grid_key = None
+        # Shield outline, core and range rings as origin-centered paths,
+        # rebuilt only when the on-screen radius changes
+        self._shield_path_key = None
+        self._shield_outer_path = QPainterPath()
+        self._shield_core_path = QPainterPath()
+        self._shield_rings_path = QPainterPath()
+        # Directional range strokes and labels, rebuilt when ranges or the
+        # center move
+        self._ranges_key = None
+        self._range_lines_path = QPainterPath()
+        self._range_arcs_path = QPainterPath()
+        self._vertical_path = QPainterPath()
+        self._range_labels = []
+        self._vertical_labels = []
+        # Shield and range layers recorded once and replayed on every paint;
+        # re-recorded only when a setter or resize marks them dirty
+        self._scene_pic = QPicture()
+        self._scene_dirty = True
+        # Formatted status lines, rebuilt after a setter changes their values
+        self._status_lines = None
         self.current_direction = 0  # 0-359 degrees
         self.bubble_radius = 100
         self.zoom_level = 1.0
@@ -33,6 +119,9 @@ class DirectionalBubbleWidget(QWidget):
             'down': 1
         }
         
+        # Fonts need the application instance, so they are per widget
+        self._font_status = QFont("Arial", 10)
+        
         self.setMinimumSize(500, 400)
         self.setStyleSheet("""
             DirectionalBubbleWidget {
@@ -42,31 +131,81 @@ class DirectionalBubbleWidget(QWidget):
             }
         """)
         
-        # Timer for real-time updates
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(1000)  # Update every second
+        # No refresh timer - the setters below repaint only when state changes
+        
+        # Sample devices for visualization until real ones are supplied
+        self.update_devices(self.generate_sample_devices())
         
     def update_direction(self, direction):
         """Update bubble shield direction"""
+        if direction == self.current_direction:
+            return
         self.current_direction = direction
-        self.update()
+        self._status_lines = None
+        # Direction moves nothing outside the scene's reach
+        self.update(self.scene_region())
         
     def update_range(self, direction, range_value):
         """Update range for specific direction"""
-        if direction in self.directional_ranges:
+        if direction not in self.directional_ranges or self.directional_ranges[direction] != range_value:
             self.directional_ranges[direction] = range_value
+            self._scene_dirty = True
             self.update()
             
+    def set_shield_active(self, active):
+        """Show the shield as active or inactive"""
+        if active == self.shield_active:
+            return
+        self.shield_active = active
+        self._scene_dirty = True
+        self._status_lines = None
+        self.update(self.scene_region())
+        
+    def set_zoom_level(self, zoom_level):
+        """Scale the shield and directional indicator"""
+        if zoom_level == self.zoom_level:
+            return
+        self.zoom_level = zoom_level
+        self._scene_dirty = True
+        self._status_lines = None
+        self.update()
+        
     def update_devices(self, device_list):
         """Update device list for visualization"""
-        self.devices = device_list
+        if device_list == self.devices:
+            return
+        # Keep a snapshot (list and device dicts) so a caller that edits its
+        # list in place and passes it back is compared against the old contents
+        self.devices = [dict(d) for d in device_list]
+        device_list = self.devices
+        self._status_lines = None
+        
+        self._device_zone_angles = tuple(
+            None if zone == 'center' else ZONE_ANGLES.get(zone, 0)
+            for zone in (d.get('detection_zone', 'center') for d in device_list)
+        )
+        self._device_radii = tuple(d.get('distance', 5) * 8 for d in device_list)  # Scale for visualization
+        self._device_threats = tuple(
+            level if level in THREAT_STYLES else 'low'
+            for level in (d.get('threat_level', 'medium') for d in device_list)
+        )
+        self._device_infos = tuple(
+            f"{d.get('phone_type', 'Device')}\n{d.get('signal', -50)}dBm" for d in device_list
+        )
+        # Random variation belongs to the device, not the frame
+        self._jitter = tuple(random.uniform(-30, 30) for _ in device_list)
+        self._device_layout_key = None  # Re-layout on next paint
         self.update()
         
     def update_display(self):
-        """Update display with current data"""
+        """Force a repaint with current data"""
         self.update()
         
+    def resizeEvent(self, event):
+        """The recorded scene is drawn around the old center"""
+        self._scene_dirty = True
+        super().resizeEvent(event)
+        
     def paintEvent(self, event):
         """Paint the 3D directional bubble shield map"""
         painter = QPainter(self)
@@ -78,63 +217,128 @@ class DirectionalBubbleWidget(QWidget):
         center_x = width // 2
         center_y = height // 2
         
+        # Only layers that overlap the dirty region are redrawn
+        region = event.region()
+        
         # Draw background grid
         self.draw_background_grid(painter, width, height)
         
-        # Draw bubble shield perimeter
-        self.draw_bubble_shield(painter, center_x, center_y)
-        
-        # Draw directional indicator
-        self.draw_directional_indicator(painter, center_x, center_y)
-        
-        # Draw detected devices
-        self.draw_devices(painter, center_x, center_y)
-        
-        # Draw directional range indicators
-        self.draw_directional_ranges(painter, center_x, center_y)
+        if region.intersects(self.scene_rect(center_x, center_y)):
+            # Bubble shield perimeter and directional range indicators
+            if self._scene_dirty:
+                self.record_scene(center_x, center_y)
+            painter.drawPicture(0, 0, self._scene_pic)
+            
+            # Draw directional indicator
+            self.draw_directional_indicator(painter, center_x, center_y)
+            
+            # Draw detected devices
+            self.draw_devices(painter, center_x, center_y)
         
         # Draw shield status
-        self.draw_shield_status(painter, width, height)
+        if region.intersects(self._STATUS_RECT):
+            self.draw_shield_status(painter, width, height)
+        
+    def record_scene(self, center_x, center_y):
+        """Record the shield and range layers into the scene picture"""
+        self._scene_pic = QPicture()
+        scene_painter = QPainter(self._scene_pic)
+        scene_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.draw_bubble_shield(scene_painter, center_x, center_y)
+        self.draw_directional_ranges(scene_painter, center_x, center_y)
+        scene_painter.end()
+        self._scene_dirty = False
+        
+    def scene_rect(self, center_x, center_y):
+        """Conservative bounds of everything drawn around the center"""
+        reach = max(
+            int(self.bubble_radius * self.zoom_level),
+            max(self.directional_ranges.values()) * 3,
+            int(max(self._device_radii, default=0))
+        ) + 120  # Labels and arrow head
+        return QRect(center_x - reach, center_y - reach, reach * 2, reach * 2)
+        
+    def scene_region(self):
+        """Region to repaint when the scene changes without changing its reach"""
+        center_x = self.width() // 2
+        center_y = self.height() // 2
+        return QRegion(self.scene_rect(center_x, center_y)) + QRegion(self._STATUS_RECT)
         
     def draw_background_grid(self, painter, width, height):
         """Draw background grid pattern"""
-        painter.setPen(QPen(QColor(0, 50, 0), 1))
-        
-        # Vertical lines
-        for x in range(0, width, 25):
-            painter.drawLine(x, 0, x, height)
+        ratio = self.devicePixelRatioF()
+        grid_key = (width, height, ratio)
+        if grid_key != self._grid_key:
+            # Transparent so the stylesheet background shows through
+            self._grid_cache = QPixmap(int(width * ratio), int(height * ratio))
+            self._grid_cache.setDevicePixelRatio(ratio)
+            self._grid_cache.fill(Qt.GlobalColor.transparent)
+            
+            grid_painter = QPainter(self._grid_cache)
+            grid_painter.setPen(self._PEN_GRID)
             
-        # Horizontal lines
-        for y in range(0, height, 25):
-            painter.drawLine(0, y, width, y)
+            # Vertical lines
+            for x in range(0, width, 25):
+                grid_painter.drawLine(x, 0, x, height)
+                
+            # Horizontal lines
+            for y in range(0, height, 25):
+                grid_painter.drawLine(0, y, width, y)
+                
+            grid_painter.end()
+            self._grid_key = grid_key
+            
+        painter.drawPixmap(0, 0, self._grid_cache)
             
     def draw_bubble_shield(self, painter, center_x, center_y):
         """Draw the bubble shield perimeter"""
         # Outer shield boundary
         if self.shield_active:
-            painter.setPen(QPen(QColor(0, 255, 0), 3))
-            painter.setBrush(QBrush(QColor(0, 255, 0, 20)))
+            painter.setPen(self._PEN_SHIELD_ACTIVE)
+            painter.setBrush(self._BRUSH_SHIELD_ACTIVE)
         else:
-            painter.setPen(QPen(QColor(255, 0, 0), 3))
-            painter.setBrush(QBrush(QColor(255, 0, 0, 20)))
+            painter.setPen(self._PEN_SHIELD_INACTIVE)
+            painter.setBrush(self._BRUSH_SHIELD_INACTIVE)
             
         radius = int(self.bubble_radius * self.zoom_level)
-        painter.drawEllipse(center_x - radius, center_y - radius, radius * 2, radius * 2)
+        if radius != self._shield_path_key:
+            self.build_shield_paths(radius)
+            
+        # Paths are built around the origin; the brush set above stays in
+        # effect for later drawing, as before
+        painter.translate(center_x, center_y)
+        painter.drawPath(self._shield_outer_path)
         
         # Inner core zone
-        painter.setPen(QPen(QColor(255, 255, 0), 2))
-        core_radius = radius // 3
-        painter.drawEllipse(center_x - core_radius, center_y - core_radius, core_radius * 2, core_radius * 2)
+        painter.setPen(self._PEN_CORE)
+        painter.drawPath(self._shield_core_path)
         
         # Range rings
-        painter.setPen(QPen(QColor(0, 150, 0), 1))
+        painter.setPen(self._PEN_RINGS)
+        painter.drawPath(self._shield_rings_path)
+        painter.translate(-center_x, -center_y)
+        
+    def build_shield_paths(self, radius):
+        """Rebuild the shield outline, core and range ring paths for a radius"""
+        self._shield_outer_path = QPainterPath()
+        self._shield_outer_path.addEllipse(QRectF(-radius, -radius, radius * 2, radius * 2))
+        
+        core_radius = radius // 3
+        self._shield_core_path = QPainterPath()
+        self._shield_core_path.addEllipse(QRectF(-core_radius, -core_radius, core_radius * 2, core_radius * 2))
+        
+        # Winding fill so nested rings tint evenly instead of alternating
+        self._shield_rings_path = QPainterPath()
+        self._shield_rings_path.setFillRule(Qt.FillRule.WindingFill)
         for ring in range(1, 4):
             ring_radius = (radius * ring) // 4
-            painter.drawEllipse(center_x - ring_radius, center_y - ring_radius, ring_radius * 2, ring_radius * 2)
+            self._shield_rings_path.addEllipse(QRectF(-ring_radius, -ring_radius, ring_radius * 2, ring_radius * 2))
+            
+        self._shield_path_key = radius
             
     def draw_directional_indicator(self, painter, center_x, center_y):
         """Draw directional focus indicator"""
-        painter.setPen(QPen(QColor(255, 255, 0), 3))
+        painter.setPen(self._PEN_ARROW)
         
         # Convert direction to radians
         angle_rad = math.radians(self.current_direction)
@@ -144,8 +348,6 @@ class DirectionalBubbleWidget(QWidget):
         end_x = center_x + int(arrow_length * math.cos(angle_rad))
         end_y = center_y + int(arrow_length * math.sin(angle_rad))
         
-        painter.drawLine(center_x, center_y, end_x, end_y)
-        
         # Draw arrow head
         head_size = 10
         head_angle1 = angle_rad + math.pi * 0.8
@@ -156,154 +358,171 @@ class DirectionalBubbleWidget(QWidget):
         head2_x = end_x + int(head_size * math.cos(head_angle2))
         head2_y = end_y + int(head_size * math.sin(head_angle2))
         
-        painter.drawLine(end_x, end_y, head1_x, head1_y)
-        painter.drawLine(end_x, end_y, head2_x, head2_y)
+        # Shaft and both head strokes as one polyline
+        painter.drawPolyline(QPolygonF([
+            QPointF(center_x, center_y), QPointF(end_x, end_y),
+            QPointF(head1_x, head1_y), QPointF(end_x, end_y),
+            QPointF(head2_x, head2_y)
+        ]))
         
         # Direction label
-        painter.setPen(QPen(QColor(255, 255, 255), 1))
+        painter.setPen(self._PEN_TEXT)
         painter.drawText(end_x + 15, end_y, f"{self.current_direction}°")
         
     def draw_devices(self, painter, center_x, center_y):
         """Draw detected devices on the map"""
-        if not self.devices:
-            # Generate some sample devices for visualization
-            self.devices = self.generate_sample_devices()
+        # Center-zone devices follow the current direction
+        layout_key = (center_x, center_y, self.current_direction)
+        if layout_key != self._device_layout_key:
+            self._device_markers, self._device_labels = self.layout_devices(center_x, center_y)
+            self._device_layout_key = layout_key
             
-        for device in self.devices:
-            # Calculate device position based on zone and distance
-            device_angle = self.get_zone_angle(device.get('detection_zone', 'center'))
-            device_distance = device.get('distance', 5) * 8  # Scale for visualization
+        # One pen/brush change per threat level rather than per device
+        for threat_level, points in self._device_markers.items():
+            pen, brush, size = THREAT_STYLES[threat_level]
+            painter.setPen(pen)
+            painter.setBrush(brush)
+            for device_x, device_y in points:
+                painter.drawEllipse(device_x - size, device_y - size, size * 2, size * 2)
+                
+        # Draw device info
+        painter.setPen(self._PEN_TEXT)
+        for label_x, label_y, device_info in self._device_labels:
+            painter.drawText(label_x, label_y, device_info)
             
-            # Add some random variation
-            device_angle += random.uniform(-30, 30)
+    def layout_devices(self, center_x, center_y):
+        """Compute screen positions grouped by threat level, plus labels"""
+        markers = {}
+        labels = []
+        for zone_angle, device_distance, threat_level, device_info, jitter in zip(
+                self._device_zone_angles, self._device_radii, self._device_threats,
+                self._device_infos, self._jitter):
+            # Position from zone and distance plus the device's random variation
+            if zone_angle is None:
+                zone_angle = self.current_direction
+            angle_rad = math.radians(zone_angle + jitter)
             
             # Convert to screen coordinates
-            angle_rad = math.radians(device_angle)
             device_x = center_x + int(device_distance * math.cos(angle_rad))
             device_y = center_y + int(device_distance * math.sin(angle_rad))
             
-            # Draw device based on threat level
-            threat_level = device.get('threat_level', 'medium')
-            if threat_level == 'critical':
-                color = QColor(255, 0, 0)  # Red
-                size = 8
-            elif threat_level == 'high':
-                color = QColor(255, 165, 0)  # Orange
-                size = 6
-            elif threat_level == 'medium':
-                color = QColor(255, 255, 0)  # Yellow
-                size = 5
-            else:
-                color = QColor(0, 255, 0)  # Green
-                size = 4
-                
-            painter.setPen(QPen(color, 2))
-            painter.setBrush(QBrush(color))
-            painter.drawEllipse(device_x - size, device_y - size, size * 2, size * 2)
+            # Group by threat level for batched styling
+            markers.setdefault(threat_level, []).append((device_x, device_y))
+            labels.append((device_x + 10, device_y, device_info))
             
-            # Draw device info
-            painter.setPen(QPen(QColor(255, 255, 255), 1))
-            device_info = f"{device.get('phone_type', 'Device')}\n{device.get('signal', -50)}dBm"
-            painter.drawText(device_x + 10, device_y, device_info)
+        return markers, labels
             
     def get_zone_angle(self, zone):
         """Convert zone name to angle"""
-        zone_angles = {
-            'north': 270,
-            'south': 90,
-            'east': 0,
-            'west': 180,
-            'center': self.current_direction
-        }
-        return zone_angles.get(zone, 0)
+        if zone == 'center':
+            return self.current_direction
+        return ZONE_ANGLES.get(zone, 0)
         
     def generate_sample_devices(self):
         """Generate sample devices for visualization"""
-        zones = ['north', 'south', 'east', 'west', 'center']
-        phone_types = ['iPhone', 'Android', 'Samsung', 'Google Pixel']
-        threat_levels = ['low', 'medium', 'high', 'critical']
-        
-        devices = []
-        for i in range(random.randint(3, 8)):
-            devices.append({
-                'detection_zone': random.choice(zones),
-                'phone_type': random.choice(phone_types),
-                'signal': random.randint(-80, -30),
-                'distance': random.uniform(2, 20),
-                'threat_level': random.choice(threat_levels)
-            })
-            
-        return devices
+        count = random.randint(3, 8)
+        
+        # Draw each field for every device in one batched call
+        zones = random.choices(SAMPLE_ZONES, k=count)
+        phone_types = random.choices(SAMPLE_PHONE_TYPES, k=count)
+        signals = random.choices(SAMPLE_SIGNALS, k=count)
+        distances = [random.uniform(2, 20) for _ in range(count)]
+        threat_levels = random.choices(SAMPLE_THREAT_LEVELS, k=count)
+        
+        return [
+            {
+                'detection_zone': zone,
+                'phone_type': phone_type,
+                'signal': signal,
+                'distance': distance,
+                'threat_level': threat_level
+            }
+            for zone, phone_type, signal, distance, threat_level
+            in zip(zones, phone_types, signals, distances, threat_levels)
+        ]
         
     def draw_directional_ranges(self, painter, center_x, center_y):
         """Draw directional range indicators"""
-        painter.setPen(QPen(QColor(255, 255, 0, 100), 2))
-        
-        # Direction mappings (angle in degrees)
-        directions = {
-            'north': 270,
-            'south': 90,
-            'east': 0,
-            'west': 180
-        }
+        ranges_key = (tuple(self.directional_ranges.items()), center_x, center_y)
+        if ranges_key != self._ranges_key:
+            self.build_range_paths(center_x, center_y)
+            self._ranges_key = ranges_key
+            
+        # Lines and arcs are open strokes - keep the shield brush off them
+        brush = painter.brush()
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.setPen(self._PEN_RANGE_LINES)
+        painter.drawPath(self._range_lines_path)
+        painter.setPen(self._PEN_RANGE_ARCS)
+        painter.drawPath(self._range_arcs_path)
+        
+        # Draw range labels
+        painter.setPen(self._PEN_TEXT)
+        for label_x, label_y, label in self._range_labels:
+            painter.drawText(label_x, label_y, label)
+            
+        # Draw vertical range indicators (Up/Down)
+        painter.setBrush(brush)
+        painter.setPen(self._PEN_VERTICAL)
+        painter.drawPath(self._vertical_path)
+        for label_x, label_y, label in self._vertical_labels:
+            painter.drawText(label_x, label_y, label)
+            
+    def build_range_paths(self, center_x, center_y):
+        """Rebuild range line, arc and up/down paths plus their labels"""
+        self._range_lines_path = QPainterPath()
+        self._range_arcs_path = QPainterPath()
+        self._range_labels = []
         
-        # Draw range indicators for each direction
-        for direction, angle in directions.items():
+        for direction, angle, cos_a, sin_a in DIRECTION_VECTORS:
             range_value = self.directional_ranges.get(direction, 25)
             range_pixels = range_value * 3  # Scale for visualization
             
-            # Convert angle to radians
-            angle_rad = math.radians(angle)
-            
-            # Calculate end point
-            end_x = center_x + int(range_pixels * math.cos(angle_rad))
-            end_y = center_y + int(range_pixels * math.sin(angle_rad))
+            # Range line out from the center
+            self._range_lines_path.moveTo(center_x, center_y)
+            self._range_lines_path.lineTo(center_x + int(range_pixels * cos_a),
+                                          center_y + int(range_pixels * sin_a))
             
-            # Draw range line
-            painter.drawLine(center_x, center_y, end_x, end_y)
+            # Range arc
+            arc_rect = QRectF(center_x - range_pixels, center_y - range_pixels, range_pixels * 2, range_pixels * 2)
+            self._range_arcs_path.arcMoveTo(arc_rect, angle - 15)
+            self._range_arcs_path.arcTo(arc_rect, angle - 15, 30)
             
-            # Draw range arc
-            painter.setPen(QPen(QColor(255, 255, 0, 80), 1))
-            arc_rect = center_x - range_pixels, center_y - range_pixels, range_pixels * 2, range_pixels * 2
-            painter.drawArc(*arc_rect, int((angle - 15) * 16), int(30 * 16))
+            # Range label
+            label_x = center_x + int((range_pixels + 20) * cos_a)
+            label_y = center_y + int((range_pixels + 20) * sin_a)
+            self._range_labels.append((label_x, label_y, f"{range_value}m"))
             
-            # Draw range label
-            label_x = center_x + int((range_pixels + 20) * math.cos(angle_rad))
-            label_y = center_y + int((range_pixels + 20) * math.sin(angle_rad))
-            painter.setPen(QPen(QColor(255, 255, 255), 1))
-            painter.drawText(label_x, label_y, f"{range_value}m")
-            
-        # Draw vertical range indicators (Up/Down)
         up_range = self.directional_ranges.get('up', 15)
         down_range = self.directional_ranges.get('down', 15)
-        
-        # Up indicator (smaller circle above center)
-        painter.setPen(QPen(QColor(0, 255, 255, 100), 2))
         up_radius = up_range * 2
-        painter.drawEllipse(center_x - up_radius//2, center_y - 50 - up_radius//2, up_radius, up_radius)
-        painter.drawText(center_x - 15, center_y - 60, f"🔼{up_range}m")
-        
-        # Down indicator (smaller circle below center)
         down_radius = down_range * 2
-        painter.drawEllipse(center_x - down_radius//2, center_y + 50 - down_radius//2, down_radius, down_radius)
-        painter.drawText(center_x - 15, center_y + 80, f"🔽{down_range}m")
         
-    def draw_shield_status(self, painter, width, height):
-        """Draw shield status information"""
-        painter.setPen(QPen(QColor(255, 255, 255), 1))
-        painter.setFont(QFont("Arial", 10))
-        
-        status_text = [
-            f"🛡️ Bubble Shield: {'ACTIVE' if self.shield_active else 'INACTIVE'}",
-            f"🎯 Direction: {self.current_direction}°",
-            f"📡 Devices: {len(self.devices)}",
-            f"🔍 Zoom: {self.zoom_level:.1f}x"
+        # Up indicator (smaller circle above center), down indicator below
+        self._vertical_path = QPainterPath()
+        self._vertical_path.addEllipse(QRectF(center_x - up_radius//2, center_y - 50 - up_radius//2, up_radius, up_radius))
+        self._vertical_path.addEllipse(QRectF(center_x - down_radius//2, center_y + 50 - down_radius//2, down_radius, down_radius))
+        self._vertical_labels = [
+            (center_x - 15, center_y - 60, f"🔼{up_range}m"),
+            (center_x - 15, center_y + 80, f"🔽{down_range}m")
         ]
         
-        y_offset = 20
-        for text in status_text:
+    def draw_shield_status(self, painter, width, height):
+        """Draw shield status information"""
+        painter.setPen(self._PEN_TEXT)
+        painter.setFont(self._font_status)
+        
+        if self._status_lines is None:
+            status_text = [
+                f"🛡️ Bubble Shield: {'ACTIVE' if self.shield_active else 'INACTIVE'}",
+                f"🎯 Direction: {self.current_direction}°",
+                f"📡 Devices: {len(self.devices)}",
+                f"🔍 Zoom: {self.zoom_level:.1f}x"
+            ]
+            self._status_lines = [(20 + 20 * i, text) for i, text in enumerate(status_text)]
+            
+        for y_offset, text in self._status_lines:
             painter.drawText(10, y_offset, text)
-            y_offset += 20
 
 
 class DirectionalControlsWidget(QWidget):
@@ -322,6 +541,14 @@ class DirectionalControlsWidget(QWidget):
             'up': 2,
             'down': 1
         }
+        
+        # Slider drags fire valueChanged per pixel; emit at most once per frame
+        self._pending_direction = None
+        self._direction_debounce = QTimer(self)
+        self._direction_debounce.setSingleShot(True)
+        self._direction_debounce.setInterval(16)  # ~60 Hz
+        self._direction_debounce.timeout.connect(self.flush_direction)
+        
         self.init_ui()
         
     def init_ui(self):
@@ -358,7 +585,7 @@ class DirectionalControlsWidget(QWidget):
         
         for i, (text, angle) in enumerate(preset_buttons):
             btn = QPushButton(text)
-            btn.clicked.connect(lambda checked, a=angle: self.set_direction(a))
+            btn.clicked.connect(partial(self.on_preset_clicked, angle))
             direction_layout.addWidget(btn, 1, i)
             
         layout.addWidget(direction_group)
@@ -389,7 +616,7 @@ class DirectionalControlsWidget(QWidget):
             slider = QSlider(Qt.Orientation.Horizontal)
             slider.setRange(1, 50)  # 1m to 50m range
             slider.setValue(self.ranges[direction])
-            slider.valueChanged.connect(lambda v, d=direction: self.on_range_changed(d, v))
+            slider.valueChanged.connect(partial(self.on_range_changed, direction))
             self.range_sliders[direction] = slider
             range_layout.addWidget(slider, row * 2, col * 2 + 1)
             
@@ -440,6 +667,18 @@ class DirectionalControlsWidget(QWidget):
         else:
             self.direction_slider.setValue(value)
             
+        # Coalesce into one emit per debounce interval
+        self._pending_direction = value
+        if not self._direction_debounce.isActive():
+            self._direction_debounce.start()
+            
+    def flush_direction(self):
+        """Emit the latest direction after the debounce interval"""
+        value = self._pending_direction
+        if value is None:
+            return
+        self._pending_direction = None
+        
         # Emit signal
         self.direction_changed.emit(value)
         
@@ -451,6 +690,10 @@ class DirectionalControlsWidget(QWidget):
         self.direction_slider.setValue(angle)
         self.direction_spinbox.setValue(angle)
         
+    def on_preset_clicked(self, angle, checked=False):
+        """Preset button slot - clicked() also passes the checked state"""
+        self.set_direction(angle)
+        
     def toggle_shield(self):
         """Toggle shield active/inactive"""
         if self.shield_toggle.isChecked():
@@ -4,10 +4,249 @@ PDF Guide Generator for EMF Chaos Engine
 Converts markdown guide to professional PDF with AIMF LLC branding
 """
 
-import markdown
-import weasyprint
+import hashlib
+import functools
+from importlib.util import find_spec
 from pathlib import Path
 
+# Converters and engines are only looked up here; each is imported by the
+# function that uses it, so importing this module stays cheap (WeasyPrint
+# alone pulls in Pango/Cairo through cffi)
+
+# Markdown converters: markdown-it-py is several times faster than
+# Python-Markdown on long documents; either one will do
+HAS_MARKDOWN_IT = find_spec('markdown_it') is not None
+HAS_MARKDOWN = find_spec('markdown') is not None
+
+# PDF engines: xhtml2pdf draws the PDF directly and is much quicker on a
+# document this size; WeasyPrint (Pango/Cairo) is the fallback
+HAS_XHTML2PDF = find_spec('xhtml2pdf') is not None
+HAS_WEASYPRINT = find_spec('weasyprint') is not None
+
+# Running header and page counter for each engine. WeasyPrint uses CSS
+# paged-media margin boxes; xhtml2pdf uses static frames filled from
+# elements in the body
+WEASYPRINT_PAGE_CSS = """
+@page {
+    size: A4;
+    margin: 1in;
+    @top-center {
+        content: "EMF Ambient Chaos Engine - AIMF LLC";
+        font-size: 10pt;
+        color: #666;
+    }
+    @bottom-center {
+        content: "Page " counter(page) " of " counter(pages);
+        font-size: 10pt;
+        color: #666;
+    }
+}
+"""
+
+XHTML2PDF_PAGE_CSS = """
+@page {
+    size: a4 portrait;
+    margin: 1in;
+    @frame page_header {
+        -pdf-frame-content: page-header;
+        top: 0.4in;
+        margin-left: 1in;
+        margin-right: 1in;
+        height: 0.4in;
+    }
+    @frame page_footer {
+        -pdf-frame-content: page-footer;
+        bottom: 0.4in;
+        margin-left: 1in;
+        margin-right: 1in;
+        height: 0.4in;
+    }
+}
+
+#page-header, #page-footer {
+    text-align: center;
+    font-size: 10pt;
+    color: #666;
+}
+"""
+
+# Guide typography shared by both engines
+GUIDE_CSS = """
+body {
+    font-family: 'Georgia', 'Times New Roman', serif;
+    line-height: 1.6;
+    color: #333;
+    max-width: 100%;
+    margin: 0;
+    padding: 0;
+}
+
+h1 {
+    color: #1a472a;
+    border-bottom: 3px solid #2e7d32;
+    padding-bottom: 10px;
+    margin-top: 30px;
+    page-break-before: auto;
+}
+
+h2 {
+    color: #2e7d32;
+    border-bottom: 2px solid #4caf50;
+    padding-bottom: 5px;
+    margin-top: 25px;
+}
+
+h3 {
+    color: #388e3c;
+    margin-top: 20px;
+}
+
+h4 {
+    color: #4caf50;
+    margin-top: 15px;
+}
+
+code {
+    background-color: #f5f5f5;
+    padding: 2px 4px;
+    border-radius: 3px;
+    font-family: 'Courier New', monospace;
+    font-size: 0.9em;
+}
+
+pre {
+    background-color: #f8f8f8;
+    border: 1px solid #ddd;
+    border-radius: 5px;
+    padding: 15px;
+    overflow-x: auto;
+    margin: 15px 0;
+}
+
+pre code {
+    background-color: transparent;
+    padding: 0;
+}
+
+table {
+    border-collapse: collapse;
+    width: 100%;
+    margin: 15px 0;
+}
+
+th, td {
+    border: 1px solid #ddd;
+    padding: 8px;
+    text-align: left;
+}
+
+th {
+    background-color: #f2f2f2;
+    font-weight: bold;
+}
+
+blockquote {
+    border-left: 4px solid #4caf50;
+    margin: 15px 0;
+    padding-left: 15px;
+    font-style: italic;
+    color: #666;
+}
+
+.title-page {
+    text-align: center;
+    page-break-after: always;
+    margin-top: 100px;
+}
+
+.title-page h1 {
+    font-size: 2.5em;
+    color: #1a472a;
+    margin-bottom: 20px;
+    border: none;
+}
+
+.title-page h2 {
+    font-size: 1.5em;
+    color: #2e7d32;
+    margin-bottom: 40px;
+    border: none;
+}
+
+.company-info {
+    margin-top: 60px;
+    font-size: 1.2em;
+    color: #666;
+}
+
+.version-info {
+    margin-top: 40px;
+    font-size: 1em;
+    color: #888;
+}
+
+ul, ol {
+    margin: 10px 0;
+    padding-left: 30px;
+}
+
+li {
+    margin: 5px 0;
+}
+
+.highlight {
+    background-color: #fff3cd;
+    padding: 10px;
+    border-left: 4px solid #ffc107;
+    margin: 15px 0;
+}
+
+.warning {
+    background-color: #f8d7da;
+    padding: 10px;
+    border-left: 4px solid #dc3545;
+    margin: 15px 0;
+}
+
+.success {
+    background-color: #d4edda;
+    padding: 10px;
+    border-left: 4px solid #28a745;
+    margin: 15px 0;
+}
+"""
+
+XHTML2PDF_PAGE_FRAMES = """
+<div id="page-header">EMF Ambient Chaos Engine - AIMF LLC</div>
+<div id="page-footer">Page <pdf:pagenumber> of <pdf:pagecount></div>
+"""
+
+@functools.lru_cache(maxsize=None)
+def markdown_it_renderer():
+    """CommonMark renderer with tables and, when available, heading anchors"""
+    from markdown_it import MarkdownIt
+    
+    renderer = MarkdownIt('commonmark').enable('table')
+    try:
+        from mdit_py_plugins.anchors import anchors_plugin
+    except ImportError:
+        return renderer
+    # Heading ids, like Python-Markdown's toc extension
+    return renderer.use(anchors_plugin, max_level=6)
+
+def markdown_to_html(md_content):
+    """Convert the guide markdown to HTML with whichever converter is installed"""
+    if HAS_MARKDOWN_IT:
+        return markdown_it_renderer().render(md_content)
+    import markdown
+    return markdown.markdown(md_content, extensions=['tables', 'toc'])
+
+@functools.lru_cache(maxsize=None)
+def weasyprint_stylesheet():
+    """Parse the guide stylesheet for WeasyPrint once per process"""
+    import weasyprint
+    return weasyprint.CSS(string=WEASYPRINT_PAGE_CSS + GUIDE_CSS)
+
 def create_pdf_guide():
     """Convert markdown guide to professional PDF"""
     
@@ -17,11 +256,24 @@ def create_pdf_guide():
         print("❌ Guide markdown file not found!")
         return
     
-    with open(md_file, 'r', encoding='utf-8') as f:
-        md_content = f.read()
+    if not (HAS_MARKDOWN_IT or HAS_MARKDOWN):
+        print("❌ No markdown converter installed - pip install markdown-it-py (or markdown)")
+        return False
+    
+    md_content = md_file.read_text(encoding='utf-8')
     
     # Convert markdown to HTML
-    html_content = markdown.markdown(md_content, extensions=['tables', 'toc'])
+    html_content = markdown_to_html(md_content)
+    
+    # xhtml2pdf reads styles from the document; WeasyPrint gets a parsed
+    # stylesheet object instead (see weasyprint_stylesheet)
+    if HAS_XHTML2PDF:
+        inline_css, page_frames = XHTML2PDF_PAGE_CSS + GUIDE_CSS, XHTML2PDF_PAGE_FRAMES
+    elif HAS_WEASYPRINT:
+        inline_css, page_frames = "", ""
+    else:
+        print("❌ No PDF engine installed - pip install xhtml2pdf (or weasyprint)")
+        return False
     
     # Create professional HTML with CSS styling
     styled_html = f"""
@@ -30,167 +282,10 @@ def create_pdf_guide():
     <head>
         <meta charset="utf-8">
         <title>EMF Ambient Chaos Engine - Technical Guide</title>
-        <style>
-            @page {{
-                size: A4;
-                margin: 1in;
-                @top-center {{
-                    content: "EMF Ambient Chaos Engine - AIMF LLC";
-                    font-size: 10pt;
-                    color: #666;
-                }}
-                @bottom-center {{
-                    content: "Page " counter(page) " of " counter(pages);
-                    font-size: 10pt;
-                    color: #666;
-                }}
-            }}
-            
-            body {{
-                font-family: 'Georgia', 'Times New Roman', serif;
-                line-height: 1.6;
-                color: #333;
-                max-width: 100%;
-                margin: 0;
-                padding: 0;
-            }}
-            
-            h1 {{
-                color: #1a472a;
-                border-bottom: 3px solid #2e7d32;
-                padding-bottom: 10px;
-                margin-top: 30px;
-                page-break-before: auto;
-            }}
-            
-            h2 {{
-                color: #2e7d32;
-                border-bottom: 2px solid #4caf50;
-                padding-bottom: 5px;
-                margin-top: 25px;
-            }}
-            
-            h3 {{
-                color: #388e3c;
-                margin-top: 20px;
-            }}
-            
-            h4 {{
-                color: #4caf50;
-                margin-top: 15px;
-            }}
-            
-            code {{
-                background-color: #f5f5f5;
-                padding: 2px 4px;
-                border-radius: 3px;
-                font-family: 'Courier New', monospace;
-                font-size: 0.9em;
-            }}
-            
-            pre {{
-                background-color: #f8f8f8;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                padding: 15px;
-                overflow-x: auto;
-                margin: 15px 0;
-            }}
-            
-            pre code {{
-                background-color: transparent;
-                padding: 0;
-            }}
-            
-            table {{
-                border-collapse: collapse;
-                width: 100%;
-                margin: 15px 0;
-            }}
-            
-            th, td {{
-                border: 1px solid #ddd;
-                padding: 8px;
-                text-align: left;
-            }}
-            
-            th {{
-                background-color: #f2f2f2;
-                font-weight: bold;
-            }}
-            
-            blockquote {{
-                border-left: 4px solid #4caf50;
-                margin: 15px 0;
-                padding-left: 15px;
-                font-style: italic;
-                color: #666;
-            }}
-            
-            .title-page {{
-                text-align: center;
-                page-break-after: always;
-                margin-top: 100px;
-            }}
-            
-            .title-page h1 {{
-                font-size: 2.5em;
-                color: #1a472a;
-                margin-bottom: 20px;
-                border: none;
-            }}
-            
-            .title-page h2 {{
-                font-size: 1.5em;
-                color: #2e7d32;
-                margin-bottom: 40px;
-                border: none;
-            }}
-            
-            .company-info {{
-                margin-top: 60px;
-                font-size: 1.2em;
-                color: #666;
-            }}
-            
-            .version-info {{
-                margin-top: 40px;
-                font-size: 1em;
-                color: #888;
-            }}
-            
-            ul, ol {{
-                margin: 10px 0;
-                padding-left: 30px;
-            }}
-            
-            li {{
-                margin: 5px 0;
-            }}
-            
-            .highlight {{
-                background-color: #fff3cd;
-                padding: 10px;
-                border-left: 4px solid #ffc107;
-                margin: 15px 0;
-            }}
-            
-            .warning {{
-                background-color: #f8d7da;
-                padding: 10px;
-                border-left: 4px solid #dc3545;
-                margin: 15px 0;
-            }}
-            
-            .success {{
-                background-color: #d4edda;
-                padding: 10px;
-                border-left: 4px solid #28a745;
-                margin: 15px 0;
-            }}
-        </style>
+        <style>{inline_css}</style>
     </head>
     <body>
+        {page_frames}
         <div class="title-page">
             <h1>⚡ EMF Ambient Chaos Engine</h1>
             <h2>Technical Guide & Philosophy</h2>
@@ -210,13 +305,45 @@ def create_pdf_guide():
     </html>
     """
     
-    # Generate PDF
+    # Skip rendering when the markdown, styling and engine are unchanged
+    pdf_file = Path("EMF_Chaos_Engine_Guide.pdf")
+    hash_file = pdf_file.with_name(pdf_file.name + ".hash")
+    engine = "xhtml2pdf" if HAS_XHTML2PDF else "weasyprint"
+    content_hash = hashlib.blake2b(
+        f"{engine}\n{WEASYPRINT_PAGE_CSS}{GUIDE_CSS}\n{styled_html}".encode('utf-8'), digest_size=16
+    ).hexdigest()
+    
+    if pdf_file.exists() and hash_file.exists() and hash_file.read_text().strip() == content_hash:
+        print(f"✅ PDF guide is up to date (cached): {pdf_file}")
+        return True
+    
+    # Generate PDF into a temporary file so a failed render never leaves a
+    # broken PDF next to a hash that claims it is current
+    tmp_file = pdf_file.with_name(pdf_file.name + ".tmp")
     try:
         print("🌊 Converting guide to PDF...")
-        pdf_file = Path("EMF_Chaos_Engine_Guide.pdf")
         
-        # Create PDF with WeasyPrint
-        weasyprint.HTML(string=styled_html).write_pdf(pdf_file)
+        if HAS_XHTML2PDF:
+            # Create PDF with xhtml2pdf
+            from xhtml2pdf import pisa
+            with open(tmp_file, 'wb') as f:
+                result = pisa.CreatePDF(styled_html, dest=f, encoding='utf-8')
+            if result.err:
+                print(f"❌ xhtml2pdf reported {result.err} error(s)")
+                tmp_file.unlink(missing_ok=True)
+                return False
+        else:
+            # Create PDF with WeasyPrint
+            import weasyprint
+            weasyprint.HTML(string=styled_html).write_pdf(
+                tmp_file, stylesheets=[weasyprint_stylesheet()]
+            )
+        
+        # Drop the old hash first: if the swap or the write below is
+        # interrupted, the next run renders again instead of trusting it
+        hash_file.unlink(missing_ok=True)
+        tmp_file.replace(pdf_file)
+        hash_file.write_text(content_hash)
         
         print(f"✅ PDF guide created successfully: {pdf_file}")
         print(f"📄 File size: {pdf_file.stat().st_size / 1024:.1f} KB")
@@ -225,6 +352,7 @@ def create_pdf_guide():
         
     except Exception as e:
         print(f"❌ Error creating PDF: {e}")
+        tmp_file.unlink(missing_ok=True)
         return False
 
 if __name__ == "__main__":
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Fast Record Timestamps
+AIMF LLC - EMF Chaos Engine Shared Helper
+
+ISO timestamps for high-rate detection records, shared by the
+auto-logger and the AirTag tracker.
+
+Author: AIMF LLC - EMF Chaos Engine Team
+"""
+
+import time
+
+# Timestamp cache: (epoch second, formatted seconds prefix), swapped as one
+# tuple so concurrent callers never see a mismatched pair
+_ts_cache = (0, '')
+
+def fast_iso():
+    """Local-time ISO timestamp like datetime.now().isoformat(); the seconds
+    part is strftime'd at most once per second"""
+    global _ts_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _ts_cache
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(second))
+        _ts_cache = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1e6):06d}"